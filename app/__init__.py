@@ -5,5 +5,6 @@ __all__ = [
     "extract",
     "create_partiful",
     "selectors",
+    "retry",
     "settings",
 ]
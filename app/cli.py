@@ -3,36 +3,94 @@
 from __future__ import annotations
 
 import argparse
-from typing import Optional
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
-from .extract import extract, ExtractionRequest
-from .create_partiful import create_partiful_sync
+if TYPE_CHECKING:
+    from .models import EventSpec
 
 
-def main() -> None:
-    """Main CLI entry point."""
+def _timezone_arg(value: str) -> str:
+    """Validate --tz once up front so a typo fails before any extraction work."""
+    from .models import ensure_timezone
+    
+    try:
+        return ensure_timezone(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+@lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once and reuse it across calls."""
     parser = argparse.ArgumentParser(description="Generate Partiful invites from natural language")
-    parser.add_argument("text", help="Natural language description of the event")
-    parser.add_argument("--tz", default="UTC", help="Default timezone (default: UTC)")
+    parser.add_argument("text", nargs="+", help="Natural language description of the event")
+    parser.add_argument("--tz", default="UTC", type=_timezone_arg, help="Default timezone (default: UTC)")
     parser.add_argument("--wait", action="store_true", help="Wait for manual publish")
     parser.add_argument("--cover-image", help="Path to cover image file")
-    
-    args = parser.parse_args()
+    parser.add_argument("--batch", action="store_true", help="Treat each text as a separate event, one browser tab per event")
+    parser.add_argument("--dry-run", action="store_true", help="Print the extracted event without opening a browser")
+    return parser
+
+
+def _extract_event(args: argparse.Namespace) -> EventSpec:
+    """Extract the event described on the command line and report it."""
+    from .extract import extract, ExtractionRequest
     
     # Extract event data
-    req = ExtractionRequest(text=args.text, default_tz=args.tz)
+    req = ExtractionRequest(text=" ".join(args.text), default_tz=args.tz)
     response = extract(req)
     
-    # Set cover image if provided
+    event = response.event
+    msg = ""
+    
+    # Set cover image if provided (EventSpec is frozen, so copy with the update)
     if args.cover_image:
-        response.event.cover_image_path = args.cover_image
-        print(f"🖼️  Cover image set: {args.cover_image}")
+        event = event.model_copy(update={"cover_image_path": args.cover_image})
+        msg += f"🖼️  Cover image set: {args.cover_image}\n"
+    
+    msg += f"Extracted event: {event.as_human()}\nConfidence: {response.confidence:.2f}\n"
+    sys.stdout.write(msg)
+    return event
+
+
+def _extract_events(args: argparse.Namespace) -> list[EventSpec]:
+    """Extract every event of a --batch run with one OpenAI call and report them."""
+    from .extract import extract_events_batch, ExtractionRequest
+    
+    events = extract_events_batch(
+        [ExtractionRequest(text=text, default_tz=args.tz) for text in args.text]
+    )
+    if args.cover_image:
+        events = [e.model_copy(update={"cover_image_path": args.cover_image}) for e in events]
+    
+    sys.stdout.write("".join(f"Extracted event {i}: {e.as_human()}\n" for i, e in enumerate(events, 1)))
+    return events
+
+
+def main() -> None:
+    """Main CLI entry point."""
+    args = _get_parser().parse_args()
+    
+    if args.batch:
+        events = _extract_events(args)
+        if not args.dry_run:
+            from .create_partiful import create_partiful_batch_sync
+            create_partiful_batch_sync(events)
+        return
+    
+    if args.dry_run:
+        _extract_event(args)
+        return
     
-    print(f"Extracted event: {response.event.title}")
-    print(f"Confidence: {response.confidence:.2f}")
+    # Deferred so --help and argument errors don't pay for the OpenAI and Playwright imports
+    import asyncio
+    from .create_partiful import create_partiful_sync
     
-    # Fill Partiful form
-    create_partiful_sync(response.event, wait_for_publish=args.wait)
+    # Extraction runs in a worker thread while the browser launches and loads
+    # Partiful; the form is filled once both are ready
+    create_partiful_sync(asyncio.to_thread(_extract_event, args), wait_for_publish=args.wait)
 
 
 if __name__ == "__main__":
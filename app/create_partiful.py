@@ -1,109 +1,286 @@
 """Playwright automation for filling Partiful's Create invite page.
 
-ToS-safe approach: headful browser, form fill        except Exception as e:
-            print(f"\\n❌ Error during form filling: {e}")
-            print("🔧 Browser will stay open for manual completion.")
-            print("💡 Press Ctrl+C in the terminal to close the browser when done.")
-            
-            # Keep browser openeedn even on error
-            try:
-                while True:
-                    await page.wait_for_timeout(10000)  # Check every 10 seconds
-                    try:
-                        await page.evaluate("document.title")
-                    except:
-                        print("🔄 Browser was closed by user.")
-                        break
-            except KeyboardInterrupt:
-                print("\\n👋 Closing browser as requested...")
-            except Exception:
-                print("\\n🔄 Browser session ended.")
-            raise
-        finally:
-            # Only close browser if wait_for_publish was True, otherwise keep it open
-            if wait_for_publish:
-                print("\\n✅ Auto-closing browser.")
-                await browser.close()
-            # If wait_for_publish is False, browser stays open (handled in main logic above)r publishes manually.
+ToS-safe approach: headful browser, form fill only; the user reviews and publishes manually.
 """
 
 from __future__ import annotations
 
 import asyncio
+import calendar
+import mimetypes
+import re
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from pathlib import Path
+from typing import Awaitable, Optional, Sequence, Union
+from urllib.parse import urlsplit
+from weakref import WeakKeyDictionary
 
-from playwright.async_api import Browser, Page, async_playwright
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    ElementHandle,
+    Error as PlaywrightError,
+    FilePayload,
+    Locator,
+    Page,
+    Playwright,
+    Route,
+    TimeoutError as PlaywrightTimeoutError,
+    async_playwright,
+)
 
-from .models import EventSpec
+from .models import EventSpec, format_clock
 from .partiful_selectors import (
-    DATE_INPUT_SELECTORS,
     DATE_TRIGGER,
-    DESCRIPTION_INPUT_SELECTORS,
+    DESCRIPTION_INPUT_FUSED,
     DESCRIPTION_TRIGGER,
-    LOCATION_INPUT_SELECTORS,
+    IMAGE_UPLOAD_INPUT,
+    LOCATION_INPUT_FUSED,
+    LOCATION_SUGGESTION_SELECTOR,
     LOCATION_TRIGGER,
     PUBLISH_BUTTON,
     SAVE_DRAFT_BUTTON,
     TITLE_SELECTOR,
 )
+from .retry import retriable
 from .settings import settings
 
 
-async def fill_partiful_form(event: EventSpec, *, wait_for_publish: bool = False) -> None:
+# Analytics hosts that never matter for filling the form. Chromium fails their
+# DNS lookups itself, so blocking them needs no request interception (which
+# would turn off the HTTP cache)
+_TRACKER_DOMAINS = (
+    "segment.io", "segment.com", "google-analytics.com", "googletagmanager.com",
+    "doubleclick.net", "hotjar.com", "hotjar.io", "sentry.io", "intercom.io",
+    "intercom.com", "intercomcdn.com", "fullstory.com", "mixpanel.com",
+)
+_TRACKER_RESOLVER_RULES = "--host-resolver-rules=" + ", ".join(
+    rule
+    for domain in _TRACKER_DOMAINS
+    for rule in (f"MAP {domain} ~NOTFOUND", f"MAP *.{domain} ~NOTFOUND")
+)
+_HEAVY_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+# Locations like "123 Main St" that need no autocomplete suggestion
+_STREET_ADDRESS_RE = re.compile(
+    r"^\d+\s+\w+.*\b(?:St|Street|Ave|Avenue|Rd|Road|Blvd|Boulevard|Ln|Lane|Dr|Drive|Way|Ct|Court|Pl|Place)\b\.?",
+    re.IGNORECASE,
+)
+
+# Background services Chromium starts by default that a short form fill never uses
+_CHROMIUM_ARGS = [
+    "--disable-background-networking",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-ipc-flooding-protection",
+    "--no-default-browser-check",
+    "--no-first-run",
+    "--disable-sync",
+]
+# Room for Partiful's bundles in the persistent profile's HTTP cache
+_DISK_CACHE_ARG = "--disk-cache-size=104857600"
+
+
+@dataclass(frozen=True)
+class PartifulLocators:
+    """Locators the form helpers reuse on a given page."""
+    
+    title: Locator
+    date_trigger: Locator
+    dialog: Locator
+    save_button: Locator
+    time_slots: Locator
+    end_button: Locator
+    suggestions: Locator
+    description_trigger: Locator
+    description_input: Locator
+
+
+_PAGE_LOCATORS: WeakKeyDictionary[Page, PartifulLocators] = WeakKeyDictionary()
+
+
+def page_locators(page: Page) -> PartifulLocators:
+    """Return the cached locators for ``page``, building them on first use."""
+    locators = _PAGE_LOCATORS.get(page)
+    if locators is None:
+        dialog = page.locator('[role="dialog"]')
+        locators = PartifulLocators(
+            title=page.locator(TITLE_SELECTOR),
+            date_trigger=page.locator(DATE_TRIGGER).first,
+            dialog=dialog,
+            save_button=(
+                dialog.get_by_role("button", name="Save")
+                .or_(dialog.locator('button:has-text("Save")'))
+                .first
+            ),
+            time_slots=page.locator('.ptf-l-cv08W'),
+            end_button=page.locator('button:has-text("End")').first,
+            suggestions=page.locator(LOCATION_SUGGESTION_SELECTOR),
+            description_trigger=page.locator(DESCRIPTION_TRIGGER).first,
+            description_input=page.locator(DESCRIPTION_INPUT_FUSED).first,
+        )
+        _PAGE_LOCATORS[page] = locators
+    return locators
+
+
+async def filter_request(route: Route) -> None:
+    """Abort third-party images, media, fonts and styles; only routed when headless."""
+    request = route.request
+    if (
+        request.resource_type in _HEAVY_RESOURCE_TYPES
+        and not (urlsplit(request.url).hostname or "").endswith("partiful.com")
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def launch_context(p: Playwright) -> BrowserContext:
+    """Launch Chromium on the persistent profile with request filtering applied.
+    
+    The persistent profile keeps the Partiful login and the HTTP cache (JS
+    bundle) warm across runs.
+    """
+    # Routing disables the HTTP cache and sends every request through Python,
+    # so it is only used headless, where there is no user to show third-party
+    # assets to; headful runs keep them and the warm cache
+    route_requests = settings.block_third_party_requests and settings.headless
+    args = list(_CHROMIUM_ARGS)
+    if settings.block_third_party_requests:
+        args.append(_TRACKER_RESOLVER_RULES)
+    if not route_requests:
+        # The cache is only used when requests aren't intercepted
+        args.append(_DISK_CACHE_ARG)
+    context = await p.chromium.launch_persistent_context(
+        settings.browser_profile_dir,
+        headless=settings.headless,
+        args=args,
+    )
+    if route_requests:
+        await context.route("**/*", filter_request)
+    return context
+
+
+async def open_create_page(page: Page) -> None:
+    """Navigate ``page`` to the first Partiful create URL that loads."""
+    for url in settings.partiful_create_urls:
+        try:
+            print(f"Trying Partiful create page: {url}")
+            # Return once the response starts; the form appearing is the
+            # readiness signal, so neither DOMContentLoaded nor the SPA's
+            # analytics traffic going idle is waited for. The date trigger is
+            # accepted too, since the title's hashed class changes on redeploys
+            await page.goto(url, wait_until="commit", timeout=15000)
+            locators = page_locators(page)
+            await locators.title.or_(locators.date_trigger).first.wait_for(timeout=15000)
+            print(f"✅ Successfully loaded: {url}")
+            return
+        except Exception as e:
+            print(f"⚠️  Failed to load {url}: {e}")
+            continue
+    
+    raise Exception("Could not load any Partiful create URLs")
+
+
+async def fill_event(
+    page: Page,
+    event: EventSpec,
+    *,
+    cover: Optional[Awaitable[Optional[FilePayload]]] = None,
+) -> None:
+    """Fill every field of ``event`` into the create form open on ``page``.
+    
+    ``cover`` is the already-started read of the event's cover image, for
+    callers that share one read across several events; by default the image
+    is read here.
+    """
+    # The form steps share one page (keyboard focus, modals), so they run in
+    # order; reading the cover image from disk is independent and overlaps them
+    cover_task = cover
+    if cover_task is None and event.cover_image_path:
+        cover_task = asyncio.create_task(
+            asyncio.to_thread(load_cover_image, event.cover_image_path)
+        )
+    
+    print("\\n🎯 Starting form fill process...")
+    
+    # Handle any modal overlays first
+    await close_modal_overlays(page)
+    
+    # 1. Fill title
+    await fill_title(page, event.title)
+    
+    # 2. Fill date/time (this is the most complex part)
+    await fill_datetime(page, event.start, event.end)
+    
+    # 3. Fill location if provided
+    if event.location_text:
+        await fill_location(page, event.location_text)
+    
+    # 4. Fill description if provided
+    if event.description_md:
+        await fill_description(page, event.description_md)
+    
+    # 5. Upload cover image if provided
+    if cover_task is not None and event.cover_image_path:
+        # A None payload means the image couldn't be read; that was already
+        # reported, and the event is still usable without a cover
+        payload = await cover_task
+        if payload is not None:
+            await upload_cover_image(page, event.cover_image_path, payload=payload)
+
+
+def _require_title(event: EventSpec) -> EventSpec:
+    """Return ``event``, or raise ValueError if it has no title to fill."""
+    if not event.title.strip():
+        raise ValueError("Event has no title; nothing to fill")
+    return event
+
+
+async def fill_partiful_form(
+    event: Union[EventSpec, Awaitable[EventSpec]], *, wait_for_publish: bool = False
+) -> None:
     """Fill Partiful's create form with event data in a headful browser.
     
     Args:
-        event: The structured event data to fill
+        event: The structured event data to fill, or an awaitable producing it
+            (e.g. an extraction still in flight), which then overlaps the
+            browser launch and page load
         wait_for_publish: If True, waits for user to manually click publish
     """
+    if isinstance(event, EventSpec):
+        # Nothing to fill; don't pay for a browser launch just to fail
+        _require_title(event)
+        pending = None
+    else:
+        pending = asyncio.ensure_future(event)
     
     async with async_playwright() as p:
-        # Launch headful browser for user interaction
-        browser = await p.chromium.launch(headless=settings.headless)
-        context = await browser.new_context()
-        page = await context.new_page()
-        
-        # Try each create URL until one works
-        page_loaded = False
-        for url in settings.partiful_create_urls:
-            try:
-                print(f"Trying Partiful create page: {url}")
-                await page.goto(url, timeout=15000)
-                await page.wait_for_load_state("networkidle", timeout=10000)
-                page_loaded = True
-                print(f"✅ Successfully loaded: {url}")
-                break
-            except Exception as e:
-                print(f"⚠️  Failed to load {url}: {e}")
-                continue
-        
-        if not page_loaded:
-            raise Exception("Could not load any Partiful create URLs")
+        context = None
+        try:
+            # Launch headful browser for user interaction
+            context = await launch_context(p)
+            page = context.pages[0] if context.pages else await context.new_page()
+            await open_create_page(page)
+            if pending is not None:
+                # Checked before any field is touched, so an untitled or failed
+                # extraction closes the browser instead of holding it open
+                event = _require_title(await pending)
+        except BaseException:
+            # Don't leave the extraction running (or its error unread) when
+            # there is no page to fill
+            if pending is not None:
+                if pending.done() and not pending.cancelled():
+                    pending.exception()
+                pending.cancel()
+            if context is not None:
+                await context.close()
+            raise
         
         try:
-            print("\\n🎯 Starting form fill process...")
-            
-            # Handle any modal overlays first
-            await close_modal_overlays(page)
-            
-            # 1. Fill title
-            await fill_title(page, event.title)
-            
-            # 2. Fill date/time (this is the most complex part)
-            await fill_datetime(page, event.start, event.end)
-            
-            # 3. Fill location if provided
-            if event.location_text:
-                await fill_location(page, event.location_text)
-            
-            # 4. Fill description if provided
-            if event.description_md:
-                await fill_description(page, event.description_md)
-            
-            # 5. Upload cover image if provided
-            if event.cover_image_path:
-                await upload_cover_image(page, event.cover_image_path)
+            await fill_event(page, event)
             
             print("\\n✅ Form filled successfully!")
             print("📝 Please review the form and manually publish when ready.")
@@ -111,75 +288,251 @@ async def fill_partiful_form(event: EventSpec, *, wait_for_publish: bool = False
             
             if wait_for_publish:
                 print("\\n⏳ Waiting for manual publish... (browser will stay open)")
-                try:
-                    # Wait for publish button to be clicked or page navigation
-                    await page.wait_for_function(
-                        "() => window.location.href !== window.location.href", 
-                        timeout=300000  # 5 minutes
-                    )
-                    print("✅ Page changed - event likely published!")
-                except Exception:
-                    print("⏰ Timeout reached. Please publish manually if needed.")
+                await _wait_for_publish(page, context, timeout=300000)  # 5 minutes
             else:
                 print("\\n🌐 Browser will remain open for manual review and publishing...")
                 print("💡 You can review the form and click 'Publish' when ready.")
                 print("🔧 Press Ctrl+C in the terminal to close the browser when done.")
                 
-                # Keep the browser open indefinitely
-                try:
-                    while True:
-                        await page.wait_for_timeout(10000)  # Check every 10 seconds
-                        # Check if the page is still alive
-                        try:
-                            await page.evaluate("document.title")
-                        except:
-                            print("🔄 Browser was closed by user.")
-                            break
-                except KeyboardInterrupt:
-                    print("\\n👋 Closing browser as requested...")
-                except Exception:
-                    print("\\n� Browser session ended.")
+                await _hold_browser_until_closed(page, context)
                 
         except Exception as e:
             print(f"\\n❌ Error during form filling: {e}")
-            print("🔧 Taking screenshot for debugging...")
-            try:
-                await page.screenshot(path="partiful_error_debug.png", full_page=True)
-                print("� Error screenshot saved")
-            except:
-                pass
+            await _debug_snapshot(page, "partiful_error_debug.png")
+            print("🔧 Browser will stay open for manual completion.")
+            print("💡 Press Ctrl+C in the terminal to close the browser when done.")
+            await _hold_browser_until_closed(page, context)
             raise
         finally:
             # Always close browser for debugging
             print("\\n� Closing browser...")
-            await browser.close()
+            await context.close()
+
+
+async def fill_partiful_batch(events: Sequence[EventSpec]) -> None:
+    """Fill one create form per event, each in its own tab of a single browser.
+    
+    The browser is launched once for the whole batch. The steps within one form
+    share a page (keyboard focus, modals) and must run in order, but separate
+    tabs are independent, so the forms are filled concurrently, at most
+    ``settings.batch_concurrency`` at a time so large batches don't exhaust
+    memory. Tabs stay open for review until the user closes the browser.
+    """
+    for event in events:
+        # As for a single form, refuse before paying for a browser launch
+        _require_title(event)
+    
+    limit = asyncio.Semaphore(settings.batch_concurrency)
+    # Events usually share a cover (the default logo), so each distinct image
+    # is read from disk once, overlapping the browser launch
+    covers = {
+        path: asyncio.create_task(asyncio.to_thread(load_cover_image, path))
+        for path in {event.cover_image_path for event in events if event.cover_image_path}
+    }
+    
+    async def fill_tab(i: int, context: BrowserContext, event: EventSpec) -> None:
+        async with limit:
+            # The tab is opened only once a slot is free; the first event reuses
+            # the tab the persistent context starts with
+            page = context.pages[0] if i == 1 and context.pages else await context.new_page()
+            print(f"\n📋 Event {i}/{len(events)}: {event.title}")
+            try:
+                await open_create_page(page)
+                await fill_event(page, event, cover=covers.get(event.cover_image_path))
+            except Exception as e:
+                print(f"\n❌ Error filling {event.title!r}: {e}")
+                await _debug_snapshot(page, f"partiful_error_debug_{i}.png")
+    
+    async with async_playwright() as p:
+        context = await launch_context(p)
+        try:
+            await asyncio.gather(*(
+                fill_tab(i, context, event) for i, event in enumerate(events, 1)
+            ))
+            
+            print(f"\n✅ Filled {len(events)} event form(s), one per tab.")
+            print("📝 Please review each tab and manually publish when ready.")
+            print("🔧 Press Ctrl+C in the terminal to close the browser when done.")
+            await _hold_browser_until_closed(None, context)
+        finally:
+            print("\n👋 Closing browser...")
+            await context.close()
+
+
+def _closed_event(page: Optional[Page], context: BrowserContext) -> asyncio.Event:
+    """Return an event that is set once the user closes the tab (if given) or the browser."""
+    closed = asyncio.Event()
+    if page is not None:
+        page.on("close", lambda _: closed.set())
+    context.on("close", lambda _: closed.set())
+    return closed
+
+
+async def _wait_for_publish(page: Page, context: BrowserContext, *, timeout: float) -> None:
+    """Return once the page navigates away from the form, the browser closes, or ``timeout`` ms pass.
+    
+    Publishing navigates from the create form to the event page, so any URL
+    change is taken as a publish. The URL is checked on navigation events
+    (including the SPA's history updates) rather than by re-running a page
+    predicate every animation frame for the whole review period.
+    """
+    closed = _closed_event(page, context)
+    initial = page.url
+    navigated = asyncio.ensure_future(page.wait_for_url(
+        lambda url: url != initial,
+        wait_until="commit",
+        timeout=timeout,
+    ))
+    closed_wait = asyncio.ensure_future(closed.wait())
+    await asyncio.wait({navigated, closed_wait}, return_when=asyncio.FIRST_COMPLETED)
+    for task in (navigated, closed_wait):
+        task.cancel()
+    await asyncio.gather(navigated, closed_wait, return_exceptions=True)
+    
+    if closed.is_set():
+        print("🔄 Browser was closed by user.")
+    elif navigated.exception() is None:
+        print("✅ Page changed - event likely published!")
+    elif isinstance(navigated.exception(), PlaywrightTimeoutError):
+        print("⏰ Timeout reached. Please publish manually if needed.")
+    else:
+        print("\\n🔄 Browser session ended.")
+
+
+async def _hold_browser_until_closed(page: Optional[Page], context: BrowserContext) -> None:
+    """Block until the user closes the tab or window, or presses Ctrl+C.
+    
+    Waiting on close events costs nothing while the user reviews the form,
+    unlike polling the page.
+    """
+    closed = _closed_event(page, context)
+    try:
+        await closed.wait()
+        print("🔄 Browser was closed by user.")
+    except KeyboardInterrupt:
+        print("\\n👋 Closing browser as requested...")
+    except Exception:
+        print("\\n🔄 Browser session ended.")
+
+
+async def _debug_snapshot(page: Page, path: str) -> None:
+    """Save a full-page screenshot to ``path`` when debug screenshots are enabled."""
+    if not settings.debug_screenshots:
+        return
+    print("🔧 Taking screenshot for debugging...")
+    try:
+        await page.screenshot(path=path, full_page=True)
+        print(f"📸 Screenshot saved: {path}")
+    except Exception:
+        pass
+
+
+async def wait_for_state(
+    page: Page, selector: str, *, state: str = "visible", timeout: float = 2000
+) -> bool:
+    """Wait until ``selector`` reaches ``state``; return False on timeout instead of raising."""
+    try:
+        await page.wait_for_selector(selector, state=state, timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+async def wait_for_mutation(page: Page, selector: str, *, timeout: float = 3000) -> bool:
+    """Wait until ``selector`` is visible, checking on each DOM mutation rather than polling.
+    
+    For dropdowns that render a few hundred milliseconds after typing, this
+    resolves on the mutation that adds them. Returns False on timeout.
+    """
+    try:
+        return await page.evaluate(
+            """([selector, timeout]) => new Promise(resolve => {
+                // Any match counts, by the same rule as Playwright's is_visible()
+                const visible = () => [...document.querySelectorAll(selector)].some(el =>
+                    el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden');
+                if (visible()) return resolve(true);
+                const observer = new MutationObserver(() => {
+                    if (visible()) { observer.disconnect(); clearTimeout(timer); resolve(true); }
+                });
+                const timer = setTimeout(() => { observer.disconnect(); resolve(false); }, timeout);
+                observer.observe(document.body, { childList: true, subtree: true, attributes: true });
+            })""",
+            [selector, timeout],
+        )
+    except PlaywrightError:
+        return False
+
+
+async def _describe_all(page: Page, selector: str) -> list[dict]:
+    """Describe every element matching ``selector`` for debug logging in one round-trip.
+    
+    Each entry has the element's tag, trimmed text, aria-label, class and
+    whether it is visible.
+    """
+    return await page.evaluate(
+        """(selector) => [...document.querySelectorAll(selector)].map(el => ({
+            tag: el.tagName,
+            text: (el.textContent || '').trim(),
+            aria: el.getAttribute('aria-label'),
+            cls: el.className,
+            // Same rule as Playwright's is_visible(): a non-empty box and not visibility:hidden
+            visible: el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden',
+        }))""",
+        selector,
+    )
+
+
+async def _has_editable_focus(page: Page) -> bool:
+    """Return True if keyboard focus is in a text input, textarea or contenteditable."""
+    return await page.evaluate(
+        """() => {
+            const el = document.activeElement;
+            return !!el && (el.tagName === 'INPUT' || el.tagName === 'TEXTAREA' || el.isContentEditable);
+        }"""
+    )
+
+
+async def _count_calendar_parts(page: Page) -> dict[str, int]:
+    """Count calendar grids, gridcells and month navigation buttons in one round-trip."""
+    return await page.evaluate(
+        """() => ({
+            grids: document.querySelectorAll('[role="grid"]').length,
+            gridcells: document.querySelectorAll('[role="gridcell"]').length,
+            nav: [...document.querySelectorAll('button')].filter(b =>
+                /next|previous/.test(b.getAttribute('aria-label') || '')
+                || /[›‹]/.test(b.textContent || '')).length,
+        })"""
+    )
+
+
+async def read_calendar_header(page: Page) -> Optional[str]:
+    """Return the datepicker's "Month YYYY" header text, or None if it isn't shown."""
+    return await page.evaluate(
+        "() => document.querySelector('.ptf-l-2YGTl')?.textContent?.trim() || null"
+    )
 
 
 async def close_modal_overlays(page: Page) -> None:
     """Close any modal overlays that might be blocking interactions."""
+    overlay = '[role="dialog"].legacy-modal-overlay'
     try:
-        # Check for modal overlay
-        modal = await page.query_selector('[role="dialog"].legacy-modal-overlay')
-        if modal:
-            print("🔄 Closing modal overlay...")
-            # Try multiple methods to close the modal
-            await page.keyboard.press("Escape")
-            await page.wait_for_timeout(500)
-            
-            # If still there, try clicking outside
-            modal_still_there = await page.query_selector('[role="dialog"].legacy-modal-overlay')
-            if modal_still_there:
-                # Click outside the modal (at the overlay)
-                await page.click('[role="dialog"].legacy-modal-overlay', force=True)
-                await page.wait_for_timeout(500)
-                
-            # Final check
-            modal_final = await page.query_selector('[role="dialog"].legacy-modal-overlay')
-            if not modal_final:
-                print("✅ Modal overlay closed")
-            else:
-                print("⚠️  Modal overlay persists")
-    except:
+        # Nothing to do in the common case where no overlay is open
+        if await page.query_selector(overlay) is None:
+            return
+        
+        print("🔄 Closing modal overlay...")
+        await page.keyboard.press("Escape")
+        if await wait_for_state(page, overlay, state="detached", timeout=1000):
+            print("✅ Modal overlay closed")
+            return
+        
+        # Escape didn't dismiss it; click the overlay itself
+        await page.click(overlay, force=True)
+        if await wait_for_state(page, overlay, state="detached", timeout=1000):
+            print("✅ Modal overlay closed")
+        else:
+            print("⚠️  Modal overlay persists")
+    except PlaywrightError:
         pass
 
 
@@ -200,37 +553,39 @@ async def select_date_in_datepicker(page: Page, target: datetime) -> bool:
     async def get_current_month_year() -> tuple[str, str] | None:
         """Get the currently displayed month and year from the calendar header."""
         try:
-            # Look for month header with the specific class from actual HTML
-            month_header = await page.query_selector('.ptf-l-2YGTl')
-            if month_header:
-                text = await month_header.text_content()
-                if text and text.strip():
-                    print(f"📅 Current calendar shows: {text.strip()}")
-                    # Parse "August 2025" format
-                    parts = text.strip().split()
-                    if len(parts) == 2:
-                        return parts[0], parts[1]  # ("August", "2025")
+            # Read the month header (class from actual HTML) in a single round-trip
+            text = await read_calendar_header(page)
+            if text:
+                print(f"📅 Current calendar shows: {text}")
+                # Parse "August 2025" format
+                parts = text.split()
+                if len(parts) == 2:
+                    return parts[0], parts[1]  # ("August", "2025")
             return None
         except Exception as e:
             print(f"⚠️ Error getting current month: {e}")
             return None
 
-    async def click_next_month() -> bool:
-        """Click the next month navigation button."""
+    async def click_next_month(previous: str) -> bool:
+        """Click the next month navigation button and wait for the header to leave ``previous``."""
         try:
-            # Use the exact selector from actual HTML
-            next_button = await page.query_selector('button[name="next-month"]')
-            if next_button:
-                is_enabled = not await next_button.get_attribute('disabled')
-                if is_enabled:
-                    await next_button.click(force=True)
-                    await page.wait_for_timeout(300)  # Wait for calendar to update
-                    print("➡️ Clicked next month")
-                    return True
-                else:
-                    print("⚠️ Next month button is disabled")
-            else:
-                print("❌ Next month button not found")
+            # Use the exact selector from actual HTML; matching only an enabled
+            # button avoids reading its disabled attribute in a second call
+            next_button = page.locator('button[name="next-month"]:not([disabled])').first
+            if await next_button.count():
+                await retriable(lambda: next_button.click(force=True, timeout=1500))
+                # Wait for the header to show the next month rather than a fixed delay
+                try:
+                    await page.wait_for_function(
+                        "(prev) => (document.querySelector('.ptf-l-2YGTl')?.textContent?.trim() || null) !== prev",
+                        arg=previous,
+                        timeout=2000,
+                    )
+                except PlaywrightTimeoutError:
+                    pass
+                print("➡️ Clicked next month")
+                return True
+            print("❌ Next month button not found or disabled")
             return False
         except Exception as e:
             print(f"⚠️ Error clicking next month: {e}")
@@ -239,64 +594,78 @@ async def select_date_in_datepicker(page: Page, target: datetime) -> bool:
     async def click_target_day() -> bool:
         """Click on the target day in the current month view."""
         try:
-            # Find all day buttons
-            day_buttons = await page.query_selector_all('button[name="day"][role="gridcell"]')
-            print(f"📊 Found {len(day_buttons)} day buttons")
-            
-            for button in day_buttons:
-                try:
-                    button_text = await button.text_content()
-                    is_disabled = await button.get_attribute('disabled') is not None
-                    
-                    if button_text and button_text.strip() == target_day and not is_disabled:
-                        await button.click(force=True)
-                        print(f"✅ Clicked on day {target_day}")
-                        return True
-                        
-                except Exception as e:
-                    continue
+            # Match the enabled day button by its exact text; a locator is
+            # re-resolved on every retry, unlike a handle that may go stale
+            button = page.locator('button[name="day"][role="gridcell"]:not([disabled])').filter(
+                has_text=re.compile(rf"^\s*{target_day}\s*$")
+            ).first
+            if not await button.count():
+                print(f"❌ Could not find enabled day button for {target_day}")
+                return False
             
-            print(f"❌ Could not find enabled day button for {target_day}")
-            return False
+            await retriable(lambda: button.click(force=True, timeout=1500))
+            print(f"✅ Clicked on day {target_day}")
+            return True
             
         except Exception as e:
             print(f"⚠️ Error clicking target day: {e}")
             return False
 
-    # Main navigation logic
-    max_attempts = 12  # Don't navigate more than 12 months
-    attempts = 0
+    # Read the header once and work out how many months ahead the target is
+    max_months = 12  # Don't navigate more than 12 months
+    current = await get_current_month_year()
+    if not current:
+        print("❌ Could not determine current month/year")
+        return False
     
-    while attempts < max_attempts:
-        attempts += 1
-        
-        # Get current month/year displayed
-        current = await get_current_month_year()
-        if not current:
-            print("❌ Could not determine current month/year")
-            return False
-            
-        current_month, current_year = current
-        
-        # Check if we're at the target month/year
-        if current_month == target_month and current_year == target_year:
-            print(f"🎯 Reached target month: {target_month} {target_year}")
-            return await click_target_day()
-        
-        # Navigate forward if we need a future month/year
-        if (int(current_year) < int(target_year)) or \
-           (int(current_year) == int(target_year) and 
-            datetime.strptime(current_month, "%B").month < target.month):
-            
-            if not await click_next_month():
-                print("❌ Failed to navigate to next month")
-                return False
-        else:
-            print(f"⚠️ Target date {target_month} {target_year} is before current {current_month} {current_year}")
+    current_month, current_year = current
+    try:
+        shown = datetime.strptime(f"{current_month} {current_year}", "%B %Y")
+    except ValueError:
+        print(f"❌ Unrecognized calendar header: {current_month} {current_year}")
+        return False
+    
+    delta_months = (target.year - shown.year) * 12 + (target.month - shown.month)
+    if delta_months < 0:
+        print(f"⚠️ Target date {target_month} {target_year} is before current {current_month} {current_year}")
+        return False
+    if delta_months >= max_months:
+        print(f"❌ Could not reach {target_month} {target_year} within {max_months} months")
+        return False
+    
+    header = f"{current_month} {current_year}"
+    for step in range(1, delta_months + 1):
+        if not await click_next_month(header):
+            print("❌ Failed to navigate to next month")
             return False
+        years, month = divmod(shown.month - 1 + step, 12)
+        header = f"{calendar.month_name[month + 1]} {shown.year + years}"
     
-    print(f"❌ Could not reach {target_month} {target_year} after {max_attempts} attempts")
-    return False
+    # Confirm the calendar landed on the target month before picking the day
+    if delta_months and await get_current_month_year() != (target_month, target_year):
+        print(f"❌ Calendar did not reach {target_month} {target_year}")
+        return False
+    
+    print(f"🎯 Reached target month: {target_month} {target_year}")
+    return await click_target_day()
+
+
+async def _time_slot_index(page: Page) -> tuple[dict[str, int], int]:
+    """Map each time slot's normalized label (e.g. "6:00PM") to its position.
+    
+    One page.evaluate reads every slot's text; whitespace is stripped and case
+    folded in the page so "6:00 PM" and "6:00PM" resolve to the same key. The
+    total slot count is returned alongside so callers can tell when the list
+    has been re-rendered.
+    """
+    labels = await page.evaluate(
+        """() => [...document.querySelectorAll('.ptf-l-cv08W')]
+            .map(el => el.textContent.replace(/\\s+/g, '').toUpperCase())"""
+    )
+    index: dict[str, int] = {}
+    for i, label in enumerate(labels):
+        index.setdefault(label, i)  # first match wins, like a top-down scan
+    return index, len(labels)
 
 
 async def set_time_in_datepicker(page: Page, start: datetime, end: Optional[datetime]) -> bool:
@@ -306,66 +675,51 @@ async def set_time_in_datepicker(page: Page, start: datetime, end: Optional[date
     Returns True if any time was set.
     """
     success = False
-    start_time = start.strftime("%I:%M%p").lstrip("0")  # Format: "6:00PM"
-    end_time = end.strftime("%I:%M%p").lstrip("0") if end else None  # Format: "9:00PM"
+    start_time = format_clock(start)  # Format: "6:00PM"
+    end_time = format_clock(end) if end else None  # Format: "9:00PM"
 
     print(f"🕐 Looking for start time: {start_time}")
     
     try:
-        # Look for the specific time element in the time picker
-        # The time picker uses elements with class "ptf-l-cv08W" and contains time text
-        time_elements = await page.query_selector_all('.ptf-l-cv08W')
-        print(f"📋 Found {len(time_elements)} time elements")
+        # The time picker uses elements with class "ptf-l-cv08W" containing the time text
+        locators = page_locators(page)
+        time_slots = locators.time_slots
+        slots, slot_count = await _time_slot_index(page)
+        print(f"📋 Found {slot_count} time elements")
         
         # Find and click the start time
-        for time_elem in time_elements:
-            time_text = await time_elem.text_content()
-            if time_text and time_text.strip() == start_time:
-                print(f"✅ Found start time element: {time_text}")
-                await time_elem.click()
-                await page.wait_for_timeout(500)  # Wait for selection
-                success = True
-                break
-        
-        if not success:
-            print(f"⚠️ Could not find exact start time {start_time}, trying partial match...")
-            # Try partial matching (e.g., "6:00PM" matches "6:00 PM")
-            start_time_parts = start_time.replace("AM", " AM").replace("PM", " PM")
-            for time_elem in time_elements:
-                time_text = await time_elem.text_content()
-                if time_text and (time_text.strip() == start_time_parts or 
-                                time_text.replace(" ", "") == start_time):
-                    print(f"✅ Found start time with partial match: {time_text}")
-                    await time_elem.click()
-                    await page.wait_for_timeout(500)
-                    success = True
-                    break
+        start_idx = slots.get(start_time)
+        if start_idx is not None:
+            print(f"✅ Found start time element: {start_time}")
+            await retriable(lambda: time_slots.nth(start_idx).click(timeout=2000))
+            success = True
+        else:
+            print(f"⚠️ Could not find start time {start_time}")
         
         # Try to set end time if we have it and start time was successful
         if success and end_time:
             print(f"🕘 Looking for end time: {end_time}")
             
-            # After selecting start time, check if End time section appears
-            await page.wait_for_timeout(1000)  # Wait for UI to update
-            
-            # Look for End button or End time section
+            # After selecting start time, the End button appears; click() waits
+            # for it, so finding and clicking it is a single call
             try:
-                end_button = await page.query_selector('button:has-text("End")')
-                if end_button:
-                    print("🔘 Clicking End button to enable end time")
-                    await end_button.click()
-                    await page.wait_for_timeout(500)
+                try:
+                    await locators.end_button.click(timeout=1500)
+                    end_clicked = True
+                except PlaywrightTimeoutError:
+                    end_clicked = False
+                if end_clicked:
+                    print("🔘 Clicked End button to enable end time")
+                    await wait_for_state(page, '.ptf-l-cv08W', timeout=1000)
                     
-                    # Now look for end time elements
-                    end_time_elements = await page.query_selector_all('.ptf-l-cv08W')
-                    for time_elem in end_time_elements:
-                        time_text = await time_elem.text_content()
-                        if time_text and (time_text.strip() == end_time or 
-                                        time_text.replace(" ", "") == end_time):
-                            print(f"✅ Found end time element: {time_text}")
-                            await time_elem.click()
-                            await page.wait_for_timeout(500)
-                            break
+                    # The End panel usually reuses the same slot list; only
+                    # re-index when the number of slots changed
+                    if await time_slots.count() != slot_count:
+                        slots, slot_count = await _time_slot_index(page)
+                    end_idx = slots.get(end_time)
+                    if end_idx is not None:
+                        print(f"✅ Found end time element: {end_time}")
+                        await retriable(lambda: time_slots.nth(end_idx).click(timeout=2000))
                     else:
                         print(f"⚠️ Could not find end time {end_time}")
                 else:
@@ -378,90 +732,64 @@ async def set_time_in_datepicker(page: Page, start: datetime, end: Optional[date
         
     return success
 
+
 async def click_location_save(page: Page) -> bool:
     """Click the Save button in the Location modal and wait for it to close.
 
+    The click is retried with backoff while the button is still visible; Enter
+    is pressed at most once, after that, since it can also pick a suggestion.
     Returns True if the modal was closed (save likely succeeded), False otherwise.
     """
-    try:
-        # Scope actions within the dialog
-        dialog_loc = page.locator('[role="dialog"]')
-        # Primary: role-based button named Save
-        try:
-            save_btn = dialog_loc.get_by_role("button", name="Save")
-            if await save_btn.count() > 0:
-                await save_btn.first.click(force=True)
-                try:
-                    await page.wait_for_selector('[role="dialog"]', state='hidden', timeout=3000)
-                except Exception:
-                    await page.wait_for_selector('[role="dialog"]', state='detached', timeout=3000)
-                print("💾 Clicked Save; modal closed")
-                return True
-        except Exception as e:
-            print(f"⚠️  Primary Save click failed: {e}")
-
-        # Fallback 1: CSS text selector inside the dialog
+    locators = page_locators(page)
+    for delay in (0, 0.1, 0.2, 0.4, 0.8):
+        if delay:
+            await asyncio.sleep(delay)
+        # A missing button falls straight through to the keyboard fallback
+        if not await locators.save_button.is_visible():
+            if not delay:
+                print("⚠️  Save button not found")
+            break
+        if delay:
+            print("🔁 Retrying Save...")
         try:
-            btn = await page.query_selector('[role="dialog"] button:has-text("Save")')
-            if btn:
-                await btn.click(force=True)
-                try:
-                    await page.wait_for_selector('[role="dialog"]', state='hidden', timeout=3000)
-                except Exception:
-                    await page.wait_for_selector('[role="dialog"]', state='detached', timeout=3000)
-                print("💾 Clicked Save via fallback; modal closed")
-                return True
-        except Exception as e:
-            print(f"⚠️  Fallback Save click failed: {e}")
-
-        # Fallback 2: Press Enter to confirm
-        try:
-            await page.keyboard.press("Enter")
-            try:
-                await page.wait_for_selector('[role="dialog"]', state='hidden', timeout=2000)
-            except Exception:
-                await page.wait_for_selector('[role="dialog"]', state='detached', timeout=2000)
-            print("💾 Pressed Enter; modal closed")
+            await locators.save_button.click(force=True, timeout=1500)
+            # Retries wait less: the first click's modal has had time to go
+            await locators.dialog.first.wait_for(state="hidden", timeout=1000 if delay else 3000)
+            print("💾 Clicked Save; modal closed")
             return True
-        except Exception:
-            pass
-
-        # Fallback 3: Click near bottom center of dialog
-        try:
-            dialog_el = await page.query_selector('[role="dialog"]')
-            if dialog_el:
-                box = await dialog_el.bounding_box()
-                if box:
-                    await page.mouse.click(box['x'] + box['width']/2, box['y'] + box['height'] - 20)
-                    try:
-                        await page.wait_for_selector('[role="dialog"]', state='hidden', timeout=2000)
-                    except Exception:
-                        await page.wait_for_selector('[role="dialog"]', state='detached', timeout=2000)
-                    print("💾 Clicked bottom of dialog; modal closed")
-                    return True
-        except Exception:
-            pass
+        except PlaywrightError as e:
+            print(f"⚠️  Save click failed: {e}")
+    
+    # The modal may have closed just after the last wait gave up
+    if not await locators.dialog.first.is_visible():
+        return True
 
+    # Last resort: confirm the modal from the keyboard
+    try:
+        await retriable(lambda: page.keyboard.press("Enter"))
+        await locators.dialog.first.wait_for(state="hidden", timeout=2000)
+        print("💾 Pressed Enter; modal closed")
+        return True
+    except PlaywrightError:
         print("⚠️  Could not close modal via Save")
         return False
-    except Exception as e:
-        print(f"⚠️  Error clicking Save: {e}")
-        return False
 
 async def fill_title(page: Page, title: str) -> None:
     """Fill the event title."""
     if title.lower().endswith("ntitled event"):
         title = title[:-10]
     print(f"📝 Filling title: {title}")
+    title_locator = page_locators(page).title
     try:
-        # Click the title area and clear it
-        await page.click(TITLE_SELECTOR)
-        
-        # Clear any existing text (including "Untitled Event")
-        await page.keyboard.press("Delete")     # Delete selected text
-        
-        # Type the new title
-        await page.keyboard.type(title)
+        # Set the whole title in one call; this also replaces "Untitled Event"
+        try:
+            await title_locator.fill(title, timeout=2000)
+        except PlaywrightError:
+            # Not directly editable: focus it, clear the selected text and insert
+            # the title as a single input event rather than one per keystroke
+            await retriable(lambda: title_locator.click(timeout=2000))
+            await page.keyboard.press("Delete")
+            await page.keyboard.insert_text(title)
         print("✅ Title filled successfully")
     except Exception as e:
         print(f"⚠️  Could not fill title: {e}")
@@ -474,9 +802,7 @@ async def fill_datetime(page: Page, start: datetime, end: Optional[datetime]) ->
         # First, ensure no modal overlays are blocking
         await close_modal_overlays(page)
         
-        # Take screenshot before clicking
-        await page.screenshot(path="before_date_click.png")
-        print("📸 Screenshot taken before date click")
+        await _debug_snapshot(page, "before_date_click.png")
         
         # Try to find and click the date button more reliably
         date_clicked = False
@@ -487,52 +813,50 @@ async def fill_datetime(page: Page, start: datetime, end: Optional[datetime]) ->
             if date_button:
                 print("🎯 Found date button, checking properties...")
                 
-                # Check button properties
-                is_visible = await date_button.is_visible()
-                is_enabled = await date_button.is_enabled()
-                text_content = await date_button.text_content()
+                # Check button properties in one round-trip
+                props = await date_button.evaluate(
+                    """(el) => ({
+                        visible: el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden',
+                        enabled: !el.disabled && !el.closest('[aria-disabled="true"]'),
+                        text: el.textContent,
+                    })"""
+                )
+                is_visible, is_enabled, text_content = props["visible"], props["enabled"], props["text"]
                 print(f"📋 Button - Visible: {is_visible}, Enabled: {is_enabled}, Text: '{text_content}'")
                 
                 if is_visible and is_enabled:
                     await date_button.click(force=True)
-                    await page.wait_for_timeout(2000)  # Wait longer for modal
+                    await wait_for_state(page, '.ptf-l-2YGTl')  # Calendar month header
                     date_clicked = True
                     print("✅ Date button clicked via CSS selector")
                     
-                    # Take screenshot after clicking to see modal
-                    await page.screenshot(path="after_date_click.png")
-                    print("📸 Screenshot taken after date click")
-                    
-                    # Log all modal/dialog elements that appear
-                    dialogs = await page.query_selector_all('[role="dialog"]')
-                    print(f"🗨️ Found {len(dialogs)} dialog elements after click")
-                    
-                    for i, dialog in enumerate(dialogs):
-                        try:
-                            is_visible = await dialog.is_visible()
-                            inner_text = await dialog.text_content()
-                            print(f"  Dialog {i}: visible={is_visible}, text='{inner_text[:100]}...'")
-                            
-                            if is_visible and i == 0:  # Save HTML of first visible dialog
-                                dialog_html = await dialog.inner_html()
-                                with open(f"dialog_{i}_content.html", "w", encoding="utf-8") as f:
-                                    f.write(dialog_html)
-                                print(f"💾 Dialog {i} HTML saved to dialog_{i}_content.html")
-                        except Exception as e:
-                            print(f"⚠️ Error inspecting dialog {i}: {e}")
-                    
-                    # Look for calendar grid specifically
-                    grids = await page.query_selector_all('[role="grid"]')
-                    gridcells = await page.query_selector_all('[role="gridcell"]')
-                    print(f"📊 Found {len(grids)} grids and {len(gridcells)} gridcells")
+                    if settings.debug_screenshots:
+                        # The screenshot and both DOM probes are independent, so
+                        # issue them together rather than one after another
+                        _, dialogs, counts = await asyncio.gather(
+                            page.screenshot(path="after_date_click.png"),
+                            _describe_all(page, '[role="dialog"]'),
+                            _count_calendar_parts(page),
+                        )
+                        print("📸 Screenshot taken after date click")
+                        print(f"🗨️ Found {len(dialogs)} dialog elements after click")
                     
-                    # Look for month/year header elements
-                    month_texts = await page.query_selector_all('text=/January|February|March|April|May|June|July|August|September|October|November|December/')
-                    print(f"📅 Found {len(month_texts)} month text elements")
+                        for i, dialog in enumerate(dialogs):
+                            print(f"  Dialog {i}: visible={dialog['visible']}, text='{dialog['text'][:100]}...'")
+                        
+                        if dialogs and dialogs[0]["visible"]:  # Save HTML of first visible dialog
+                            try:
+                                dialog_html = await page.inner_html('[role="dialog"]')
+                                # Write off the event loop so the page keeps being serviced
+                                await asyncio.to_thread(
+                                    Path("dialog_0_content.html").write_text, dialog_html, encoding="utf-8"
+                                )
+                                print("💾 Dialog 0 HTML saved to dialog_0_content.html")
+                            except (PlaywrightError, OSError) as e:
+                                print(f"⚠️ Error inspecting dialog 0: {e}")
                     
-                    # Look for navigation buttons
-                    nav_buttons = await page.query_selector_all('button[aria-label*="next"], button[aria-label*="previous"], button:has-text("›"), button:has-text("‹")')
-                    print(f"🧭 Found {len(nav_buttons)} navigation buttons")
+                        print(f"📊 Found {counts['grids']} grids and {counts['gridcells']} gridcells")
+                        print(f"🧭 Found {counts['nav']} navigation buttons")
                     
         except Exception as e:
             print(f"⚠️ CSS selector click failed: {e}")
@@ -540,8 +864,8 @@ async def fill_datetime(page: Page, start: datetime, end: Optional[datetime]) ->
         # Method 2: Try text-based locator if CSS failed
         if not date_clicked:
             try:
-                await page.locator('text="Set a date"').first.click(force=True)
-                await page.wait_for_timeout(2000)
+                await page_locators(page).date_trigger.click(force=True)
+                await wait_for_state(page, '.ptf-l-2YGTl')
                 date_clicked = True
                 print("✅ Date button clicked via text locator")
             except Exception as e:
@@ -551,9 +875,7 @@ async def fill_datetime(page: Page, start: datetime, end: Optional[datetime]) ->
         if date_clicked:
             print("🔍 Analyzing opened date picker...")
             
-            # Wait a bit more and take another screenshot
-            await page.wait_for_timeout(1000)
-            await page.screenshot(path="date_picker_open.png")
+            await _debug_snapshot(page, "date_picker_open.png")
             
             # Try to find September 2025 in the current view
             target_month = start.strftime("%B")  # September
@@ -563,15 +885,9 @@ async def fill_datetime(page: Page, start: datetime, end: Optional[datetime]) ->
             print(f"🎯 Looking for: {target_month} {target_year}, day {target_day}")
             
             # Check what month/year is currently showing
-            current_month_elements = await page.query_selector_all('text=/January|February|March|April|May|June|July|August|September|October|November|December/')
-            for elem in current_month_elements:
-                try:
-                    text = await elem.text_content()
-                    is_visible = await elem.is_visible()
-                    if is_visible and text:
-                        print(f"📅 Visible month text: '{text}'")
-                except:
-                    continue
+            header = await read_calendar_header(page)
+            if header:
+                print(f"📅 Visible month text: '{header}'")
             
             # Try the existing date selection logic
             success = await select_date_in_datepicker(page, start)
@@ -588,13 +904,12 @@ async def fill_datetime(page: Page, start: datetime, end: Optional[datetime]) ->
                 # Close the datepicker
                 try:
                     await page.keyboard.press('Escape')
-                    await page.wait_for_timeout(500)
+                    await wait_for_state(page, '.ptf-l-2YGTl', state="hidden", timeout=1000)
                     print("🔒 Date picker closed")
                 except:
                     pass
                     
-                # Take final screenshot
-                await page.screenshot(path="after_date_selection.png")
+                await _debug_snapshot(page, "after_date_selection.png")
                 
                 # Check if the date button now shows the selected date
                 try:
@@ -615,7 +930,7 @@ async def fill_datetime(page: Page, start: datetime, end: Optional[datetime]) ->
         
         # Format date and time for display
         date_str = start.strftime("%A, %B %d, %Y")  # "Sunday, September 01, 2025"
-        time_str = start.strftime("%I:%M %p").lstrip("0")  # "6:00 PM"
+        time_str = format_clock(start, sep=" ")  # "6:00 PM"
         
         # Try to type directly into the date field or focused element
         try:
@@ -623,33 +938,38 @@ async def fill_datetime(page: Page, start: datetime, end: Optional[datetime]) ->
             date_button = await page.query_selector('.ptf-l-EDGV-')
             if date_button:
                 await date_button.click()
-                await page.wait_for_timeout(500)
+                await wait_for_state(page, '.ptf-l-2YGTl, [role="dialog"]', timeout=500)
+            
+            # Typing only helps if a field took focus; otherwise fail fast
+            if not await _has_editable_focus(page):
+                print("⚠️ No date field is focused for typing")
+                print("💡 You may need to set the date/time manually")
+                return
             
             # Clear any existing content and type the date
             await page.keyboard.press("Control+a")  # Select all
-            await page.keyboard.type(f"{date_str} at {time_str}")
+            await page.keyboard.insert_text(f"{date_str} at {time_str}")
             print(f"✅ Date/time typed as fallback: {date_str} at {time_str}")
             
             # Handle end time if provided
             if end:
-                end_time_str = end.strftime("%I:%M %p").lstrip("0")
+                end_time_str = format_clock(end, sep=" ")
                 try:
                     if end.date() == start.date():  # Same day
-                        await page.keyboard.type(f" until {end_time_str}")
+                        await page.keyboard.insert_text(f" until {end_time_str}")
                         print(f"⏰ End time added: until {end_time_str}")
                     else:
                         end_date_str = end.strftime("%A, %B %d")
-                        await page.keyboard.type(f" until {end_date_str} at {end_time_str}")
+                        await page.keyboard.insert_text(f" until {end_date_str} at {end_time_str}")
                         print(f"⏰ Multi-day end time added")
                 except:
                     print("⚠️ Could not add end time")
             
             # Press Enter to confirm
             await page.keyboard.press("Enter")
-            await page.wait_for_timeout(1000)
+            await wait_for_state(page, '.ptf-l-2YGTl', state="hidden", timeout=1000)
             
-            # Take screenshot after typing
-            await page.screenshot(path="after_typing_date.png")
+            await _debug_snapshot(page, "after_typing_date.png")
             
         except Exception as e:
             print(f"⚠️ Typing fallback failed: {e}")
@@ -659,6 +979,95 @@ async def fill_datetime(page: Page, start: datetime, end: Optional[datetime]) ->
         print(f"⚠️ Could not set date/time: {e}")
         print("💡 You may need to set the date/time manually")
 
+async def _click_suggestion(page: Page, location: str, location_input: Optional[ElementHandle]) -> bool:
+    """Click the first listed suggestion, or the modal element naming the typed place.
+    
+    Listed options are clicked through the page's cached suggestions locator,
+    which Playwright re-resolves and retries on its own. Without one, the
+    innermost element in the modal whose text contains the place name is found
+    inside the page in a single round-trip.
+    """
+    try:
+        suggestions = page_locators(page).suggestions
+        if await suggestions.count():
+            # Use force click to bypass modal overlay issues
+            await suggestions.first.click(force=True, timeout=1500)
+            print("✅ Force-clicked on first location suggestion")
+            return True
+        
+        handle = await page.evaluate_handle(
+            """(location) => {
+                const needle = location.split(',')[0].trim().toLowerCase();
+                if (!needle) return null;
+                const has = el => (el.textContent || '').toLowerCase().includes(needle);
+                const match = [...document.querySelectorAll(
+                    '[role="dialog"] div, [role="dialog"] span, [role="dialog"] button, [role="dialog"] a')]
+                    .find(el => has(el) && ![...el.children].some(has));
+                return match ? match.closest('button, a, div') || match : null;
+            }""",
+            location,
+        )
+        suggestion = handle.as_element()
+        if suggestion is None:
+            print("⚠️  No dropdown suggestions found")
+            return False
+        # A stale handle does not recover, so this click is not retried
+        await suggestion.click(force=True, timeout=1500)
+        print("✅ Force-clicked on matching location suggestion")
+        return True
+    except PlaywrightError as e:
+        print(f"⚠️  Suggestion click failed: {e}")
+        return False
+
+
+async def _select_suggestion_with_keyboard(
+    page: Page, location: str, location_input: Optional[ElementHandle]
+) -> bool:
+    """Refocus the location input and pick the first suggestion with ArrowDown + Enter."""
+    try:
+        # Close any overlays first
+        await page.keyboard.press("Escape")
+        
+        if not (location_input and await location_input.is_visible()):
+            return False
+        await location_input.focus()
+        await page.keyboard.press("ArrowDown")  # Select first suggestion
+        await wait_for_state(page, '[role="option"][aria-selected="true"]', timeout=500)
+        await page.keyboard.press("Enter")  # Confirm selection
+        print("✅ Selected suggestion using keyboard navigation after refocus")
+        return True
+    except PlaywrightError as e:
+        print(f"⚠️  Keyboard navigation failed: {e}")
+        return False
+
+
+async def _close_location_modal(page: Page, location: str, location_input: Optional[ElementHandle]) -> bool:
+    """Last resort: close the modal and keep the typed location."""
+    try:
+        print("🔧 Trying to close location modal and accept typed location...")
+        # Press Escape to close the modal and accept what was typed
+        await page.keyboard.press("Escape")
+        if await wait_for_state(page, '[role="dialog"]', state="detached", timeout=2000):
+            print("✅ Closed location modal - typed location should be preserved")
+            return True
+        # Try clicking outside the modal
+        await page.click('body', position={'x': 100, 'y': 100})
+        await wait_for_state(page, '[role="dialog"]', state="detached", timeout=1000)
+        print("✅ Clicked outside modal to close it")
+        return True
+    except PlaywrightError as e:
+        print(f"⚠️  Modal close attempt failed: {e}")
+        return False
+
+
+# Ways of committing a location suggestion, tried in order until one succeeds
+_SUGGESTION_STRATEGIES = (
+    _click_suggestion,
+    _select_suggestion_with_keyboard,
+    _close_location_modal,
+)
+
+
 async def fill_location(page: Page, location: str) -> None:
     """Fill the location field and select from dropdown suggestions, then Save."""
     print(f"📍 Filling location: {location}")
@@ -667,219 +1076,62 @@ async def fill_location(page: Page, location: str) -> None:
         await close_modal_overlays(page)
         
         # Click the first location trigger (not the second one which has issues)
-        location_elements = await page.get_by_text("Location").all()
-        if location_elements:
-            await location_elements[0].click()  # Click the first one specifically
-            await page.wait_for_timeout(1000)  # Give more time for modal to open
+        location_trigger = await page.query_selector(LOCATION_TRIGGER)
+        if location_trigger:
+            await location_trigger.click()
+            await wait_for_state(page, LOCATION_INPUT_FUSED, timeout=2000)
             
-        # Try to find and fill the location input
-        location_filled = False
-        
-        # Method 1: Look for the specific placeholder input
-        location_input = await page.query_selector('input[placeholder="Place name, address, or link"]')
+        # Fill the location input, found with one query over every fallback
+        # selector. The handle is kept so the keyboard fallback below can
+        # refocus it without another lookup
+        location_input = await page.query_selector(LOCATION_INPUT_FUSED)
         if location_input:
             await location_input.fill(location)
-            location_filled = True
             print("✅ Location typed in search field")
+        else:
+            # Last resort: type into whatever field the trigger focused, but
+            # never into the page itself, where keys act as shortcuts
+            if not await _has_editable_focus(page):
+                print("⚠️  No location field is focused; please add the location manually")
+                return
+            await page.keyboard.press("Control+a")
+            await page.keyboard.insert_text(location)
+            print("✅ Location typed in focused input")
         
-        # Method 2: Try search input type
-        if not location_filled:
-            search_input = await page.query_selector('input[type="search"]')
-            if search_input:
-                await search_input.fill(location)
-                location_filled = True
-                print("✅ Location typed in search input")
-        
-        # Method 3: Try focused input
-        if not location_filled:
-            focused_element = await page.evaluate('document.activeElement?.tagName')
-            if focused_element == 'INPUT':
-                await page.keyboard.press("Control+a")
-                await page.keyboard.type(location)
-                location_filled = True
-                print("✅ Location typed in focused input")
-        
-        if location_filled:
+        if _STREET_ADDRESS_RE.match(location):
+            # Partiful accepts a full street address as typed, so there is no
+            # suggestion to wait for
+            print("🏠 Street address given; saving as typed")
+        else:
             # Wait for dropdown suggestions to appear
             print("🔍 Waiting for location suggestions...")
-            await page.wait_for_timeout(2000)  # Wait for suggestions to load
-            
-            # Try to find and click the first suggestion
-            suggestion_clicked = False
-            
-            # Method 1: Look for actual dropdown suggestions in the location modal
-            try:
-                # Wait a bit more for dropdown to fully load
-                await page.wait_for_timeout(1000)
-                
-                # Look for the location suggestions in the modal structure
-                # Based on your screenshot, suggestions appear to be clickable elements
-                suggestions = await page.query_selector_all('div[role="option"]')
-                if not suggestions:
-                    # Try alternative selectors for location suggestions
-                    suggestions = await page.query_selector_all('.location-option, .search-suggestion, [data-testid*="location"], [data-testid*="suggestion"]')
-                
-                if not suggestions:
-                    # Look for any clickable elements that contain location text in the modal
-                    suggestions = await page.query_selector_all('div:has-text("MIT"), button:has-text("MIT"), a:has-text("MIT")')
-                
-                if suggestions and len(suggestions) > 0:
-                    # Use force click to bypass modal overlay issues
-                    await suggestions[0].click(force=True)
-                    suggestion_clicked = True
-                    print(f"✅ Force-clicked on first location suggestion (found {len(suggestions)} suggestions)")
-                else:
-                    print("⚠️  No dropdown suggestions found with standard selectors")
-            except Exception as e:
-                print(f"⚠️  Standard suggestion click failed: {e}")
-            
-            # Method 2: Try to find suggestions by looking for specific text patterns with force click
-            if not suggestion_clicked:
-                try:
-                    # Look for elements containing "MIT" specifically
-                    await page.wait_for_timeout(500)
-                    
-                    # Try clicking on text that matches MIT with force
-                    mit_element = await page.get_by_text("MIT", exact=False).first
-                    if mit_element:
-                        try:
-                            await mit_element.click(force=True)
-                            suggestion_clicked = True
-                            print("✅ Force-clicked on MIT text element")
-                        except:
-                            # Try clicking on its parent with force
-                            parent = mit_element.locator('..').first
-                            if parent:
-                                await parent.click(force=True)
-                                suggestion_clicked = True
-                                print("✅ Force-clicked on MIT parent element")
-                except Exception as e:
-                    print(f"⚠️  MIT text click failed: {e}")
-            
-            # Method 3: Look for specific location suggestions and force click
-            if not suggestion_clicked:
-                try:
-                    # Based on the error, look for Cambridge, MA specifically
-                    cambridge_elements = await page.query_selector_all('span:has-text("Cambridge, MA")')
-                    if cambridge_elements:
-                        # Find the clickable parent of the Cambridge element
-                        for elem in cambridge_elements:
-                            try:
-                                # Get the parent element that might be clickable
-                                parent = await elem.evaluate_handle('el => el.closest("div, button, a")')
-                                if parent:
-                                    await parent.click(force=True)
-                                    suggestion_clicked = True
-                                    print("✅ Force-clicked on Cambridge, MA suggestion")
-                                    break
-                            except:
-                                continue
-                except Exception as e:
-                    print(f"⚠️  Cambridge suggestion click failed: {e}")
-            
-            # Method 4: Try clicking directly on the modal location options
-            if not suggestion_clicked:
-                try:
-                    # Look for clickable elements within the location modal with force
-                    modal = await page.query_selector('[role="dialog"]')
-                    if modal:
-                        # Find any clickable elements within the modal
-                        clickable_in_modal = await modal.query_selector_all('div, span, button, a')
-                        for element in clickable_in_modal:
-                            try:
-                                text_content = await element.text_content()
-                                if text_content and ("MIT" in text_content or "Cambridge" in text_content):
-                                    await element.click(force=True)
-                                    suggestion_clicked = True
-                                    print(f"✅ Force-clicked on modal element: {text_content[:50]}...")
-                                    break
-                            except:
-                                continue
-                except Exception as e:
-                    print(f"⚠️  Modal force click failed: {e}")
-            
-            # Method 5: Use keyboard navigation with proper timing
-            if not suggestion_clicked:
-                try:
-                    # Close any overlays first
-                    await page.keyboard.press("Escape")
-                    await page.wait_for_timeout(300)
-                    
-                    # Focus back on the input and try keyboard navigation
-                    location_input = await page.query_selector('input[placeholder="Place name, address, or link"]')
-                    if location_input:
-                        await location_input.focus()
-                        await page.wait_for_timeout(200)
-                        await page.keyboard.press("ArrowDown")  # Select first suggestion
-                        await page.wait_for_timeout(300)
-                        await page.keyboard.press("Enter")  # Confirm selection
-                        suggestion_clicked = True
-                        print("✅ Selected suggestion using keyboard navigation after refocus")
-                except Exception as e:
-                    print(f"⚠️  Keyboard navigation failed: {e}")
-            
-            # Method 6: Last resort - close modal and accept typed location
-            if not suggestion_clicked:
-                try:
-                    print("🔧 Trying to close location modal and accept typed location...")
-                    # Press Escape to close the modal and accept what was typed
-                    await page.keyboard.press("Escape")
-                    await page.wait_for_timeout(500)
-                    # Check if modal is closed
-                    modal_still_open = await page.query_selector('[role="dialog"]')
-                    if not modal_still_open:
-                        suggestion_clicked = True
-                        print("✅ Closed location modal - typed location should be preserved")
-                    else:
-                        # Try clicking outside the modal
-                        await page.click('body', position={'x': 100, 'y': 100})
-                        await page.wait_for_timeout(300)
-                        print("✅ Clicked outside modal to close it")
-                        suggestion_clicked = True
-                except Exception as e:
-                    print(f"⚠️  Modal close attempt failed: {e}")
+            await wait_for_mutation(page, LOCATION_SUGGESTION_SELECTOR, timeout=3000)
             
-            if not suggestion_clicked:
+            # Try each way of picking a suggestion in priority order
+            for pick_suggestion in _SUGGESTION_STRATEGIES:
+                if await pick_suggestion(page, location, location_input):
+                    break
+            else:
                 print("⚠️  Could not select from dropdown suggestions")
                 print("💡 Location text was entered but suggestion not selected")
 
-            # Attempt to click Save to persist selection
-            try:
-                saved = await click_location_save(page)
-                if not saved:
-                    print("🔁 Retrying Save...")
-                    await page.wait_for_timeout(400)
-                    saved = await click_location_save(page)
-                if not saved:
-                    print("⚠️  Location may not be persisted; please click Save manually.")
-                else:
-                    await page.wait_for_timeout(300)
-            except Exception as e:
-                print(f"⚠️  Error while clicking Save: {e}")
-            
-        else:
-            # Fallback: try other selectors
-            for selector in LOCATION_INPUT_SELECTORS:
-                try:
-                    location_input = await page.query_selector(selector)
-                    if location_input:
-                        await location_input.fill(location)
-                        print("✅ Location filled via fallback selector")
-                        return
-                except:
-                    continue
-                    
-            # Last resort: just type the location
-            await page.keyboard.type(location)
-            print("✅ Location typed as final fallback")
+        # Attempt to click Save to persist selection
+        try:
+            if not await click_location_save(page):
+                print("⚠️  Location may not be persisted; please click Save manually.")
+        except PlaywrightError as e:
+            print(f"⚠️  Error while clicking Save: {e}")
         
-    except Exception as e:
+    except PlaywrightError as e:
         print(f"⚠️  Could not fill location: {e}")
-        # Last resort: try typing anyway
+        # Last resort: type it if a text field still has focus
         try:
-            await page.keyboard.type(location)
+            if not await _has_editable_focus(page):
+                print("⚠️  No location field is focused; please add the location manually")
+                return
+            await page.keyboard.insert_text(location)
             print("✅ Location typed via error recovery")
-        except:
+        except PlaywrightError:
             print("❌ Location filling completely failed")
 
 
@@ -888,100 +1140,152 @@ async def fill_description(page: Page, description: str) -> None:
     print("📄 Filling description...")
     try:
         # Click description trigger
-        await page.get_by_text("Add a description").first.click()
-        await page.wait_for_timeout(500)
+        await page_locators(page).description_trigger.click()
         
-        # Try to find description input
-        for selector in DESCRIPTION_INPUT_SELECTORS:
-            try:
-                desc_input = await page.query_selector(selector)
-                if desc_input:
-                    await desc_input.fill(description)
-                    print("✅ Description filled successfully")
-                    return
-            except:
-                continue
+        # The locator covers every fallback selector, so fill() waits for
+        # whichever input appears and fills it in the same call
+        try:
+            await page_locators(page).description_input.fill(description, timeout=1000)
+            print("✅ Description filled successfully")
+            return
+        except PlaywrightTimeoutError:
+            pass
                 
-        # Fallback: type description
-        await page.keyboard.type(description)
+        # Fallback: type description into whatever field the trigger focused
+        if not await _has_editable_focus(page):
+            print("⚠️  No description field is focused; please add it manually")
+            return
+        await page.keyboard.insert_text(description)
         print("✅ Description typed as fallback")
         
-    except Exception as e:
+    except PlaywrightError as e:
         print(f"⚠️  Could not fill description: {e}")
 
 
-async def upload_cover_image(page: Page, image_path: str) -> bool:
-    """Upload a cover image to the event."""
+def load_cover_image(image_path: str) -> Optional[FilePayload]:
+    """Read a cover image into an in-memory payload for ``set_input_files``."""
+    try:
+        path = Path(image_path)
+        mime_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        return {"name": path.name, "mimeType": mime_type, "buffer": path.read_bytes()}
+    except OSError as e:
+        print(f"⚠️  Could not read cover image {image_path}: {e}")
+        return None
+
+
+async def _image_sources(page: Page) -> list[str]:
+    """Return the sources of every image currently on the page."""
+    return await page.evaluate("() => [...document.images].map(img => img.currentSrc || img.src)")
+
+
+async def _wait_for_new_image(page: Page, before: list[str], timeout: float = 5000) -> bool:
+    """Wait until an image not in ``before`` has loaded, i.e. the cover preview updated."""
+    try:
+        await page.wait_for_function(
+            """(before) => [...document.images].some(img =>
+                img.complete && img.naturalWidth > 0 && !before.includes(img.currentSrc || img.src))""",
+            arg=before,
+            timeout=timeout,
+        )
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+async def upload_cover_image(
+    page: Page, image_path: str, *, payload: Optional[FilePayload] = None
+) -> bool:
+    """Upload a cover image to the event.
+    
+    If ``payload`` holds the already-read image it is uploaded from memory;
+    otherwise ``image_path`` is read here. Returns False if the image can't
+    be read.
+    """
+    if payload is None:
+        payload = load_cover_image(image_path)
+        if payload is None:
+            return False
+    files = payload
     print(f"📸 Uploading cover image: {image_path}")
     try:
-        # Wait a bit for the page to fully load after description
-        await page.wait_for_timeout(1000)
-        
         # Try to click the "Edit" button for the cover image
         try:
             await page.click("text=Edit")
             print("✅ Edit button clicked")
-        except Exception as e:
+        except PlaywrightError as e:
             print(f"⚠️  Could not click Edit button: {e}")
-            # Try alternative approach - look for any clickable element with image-related text
+            # Try alternative approach - find the innermost element with image-related
+            # text in a single in-page scan
             try:
-                elements = await page.query_selector_all('*')
-                for element in elements[:50]:  # Check first 50 elements
-                    try:
-                        text = await element.text_content()
-                        if text and any(word in text.lower() for word in ['cover', 'image', 'photo', 'picture', 'upload', 'edit']):
-                            print(f"🔍 Found potential image element with text: '{text}'")
-                            await element.click()
-                            print("✅ Clicked potential image element")
-                            break
-                    except:
-                        continue
-            except Exception as e2:
+                handle = await page.evaluate_handle(
+                    """() => {
+                        const re = /cover|image|photo|picture|upload|edit/i;
+                        const has = el => re.test(el.textContent || '');
+                        return [...document.querySelectorAll('button, [role="button"], a, span, div')]
+                            .find(el => has(el) && ![...el.children].some(has)) || null;
+                    }"""
+                )
+                element = handle.as_element()
+                if element is not None:
+                    print(f"🔍 Found potential image element with text: '{await element.text_content()}'")
+                    await element.click()
+                    print("✅ Clicked potential image element")
+            except PlaywrightError as e2:
                 print(f"⚠️  Alternative approach also failed: {e2}")
                 return False
 
-        await page.wait_for_timeout(1500) # Wait for file input to appear
+        await wait_for_state(page, IMAGE_UPLOAD_INPUT, state="attached", timeout=3000)
+        images_before = await _image_sources(page)
         
         # Now try to set the file input directly
         try:
-            await page.set_input_files("input[type='file']", image_path)
+            await page.set_input_files(IMAGE_UPLOAD_INPUT, files)
             print(f"✅ File {image_path} uploaded successfully")
-            await page.wait_for_timeout(2000) # Wait for upload to complete
+            await _wait_for_new_image(page, images_before)
             return True
-        except Exception as e:
+        except PlaywrightError as e:
             print(f"⚠️  Could not set file input: {e}")
             # Fallback: try to find file input manually
-            file_input = await page.query_selector('input[type="file"]')
+            file_input = await page.query_selector(IMAGE_UPLOAD_INPUT)
             if file_input:
-                await file_input.set_input_files(image_path)
+                await file_input.set_input_files(files)
                 print(f"✅ File {image_path} uploaded via fallback")
-                await page.wait_for_timeout(2000)
+                await _wait_for_new_image(page, images_before)
                 return True
             else:
                 print("❌ File input not found")
                 return False
                 
-    except Exception as e:
+    except (PlaywrightError, OSError) as e:
         print(f"❌ Error uploading cover image: {e}")
         return False
 
 
-def create_partiful_sync(event: EventSpec, *, wait_for_publish: bool = False) -> None:
+def create_partiful_sync(
+    event: Union[EventSpec, Awaitable[EventSpec]], *, wait_for_publish: bool = False
+) -> None:
     """Synchronous wrapper for the async Playwright automation."""
     asyncio.run(fill_partiful_form(event, wait_for_publish=wait_for_publish))
 
 
+def create_partiful_batch_sync(events: Sequence[EventSpec]) -> None:
+    """Synchronous wrapper for filling several events in one browser session."""
+    asyncio.run(fill_partiful_batch(events))
+
+
 if __name__ == "__main__":
     import sys
     from .extract import extract_event_with_llm
     from .models import ExtractionRequest
     
-    if len(sys.argv) < 2:
-        print("Usage: python -m app.create_partiful 'event description'")
+    dry_run = "--dry-run" in sys.argv
+    argv = [arg for arg in sys.argv[1:] if arg != "--dry-run"]
+    if not argv:
+        print("Usage: python -m app.create_partiful 'event description' [--dry-run]")
         print("Example: python -m app.create_partiful 'Birthday party Saturday 7pm at my house'")
         sys.exit(1)
     
-    event_text = sys.argv[1]
+    event_text = argv[0]
     print(f"🎯 Extracting event details from: {event_text}")
     
     try:
@@ -995,6 +1299,8 @@ if __name__ == "__main__":
         # Extract event using LLM
         event = extract_event_with_llm(extraction_req)
         print(f"📋 Extracted event: {event.as_human()}")
+        if dry_run:
+            sys.exit(0)
         
         # Fill Partiful form
         print("🌐 Opening Partiful and filling form...")
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import re
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
 from openai import OpenAI
 from dotenv import load_dotenv
 from zoneinfo import ZoneInfo
 
-from .models import EventSpec, ExtractionRequest, ExtractionResponse
+from .models import EventSpec, ExtractionRequest, ExtractionResponse, validate_event
 from .settings import settings
 
 # Load environment variables
@@ -18,11 +22,25 @@ load_dotenv()
 # Initialize OpenAI client
 client = OpenAI(api_key=settings.openai_api_key)
 
+_MODEL = "gpt-4o-mini"  # Using GPT-4o-mini as the most capable mini model
+_MAX_TOKENS = 1000  # Room for one event, including a long description
 
-def extract_event_with_llm(req: ExtractionRequest) -> EventSpec:
-    """Extract structured event data using OpenAI GPT model."""
-    
-    system_prompt = """You are an expert at extracting structured event information from natural language text.
+# Only texts that pin the year are cached: "Sept 7" or "7pm" alone resolve
+# against the current day just like the relative dates below
+_EXPLICIT_YEAR_RE = re.compile(r"\b(?:19|20)\d{2}\b")
+
+# Dates that resolve against the current day; results for these are never cached
+_RELATIVE_DATE_RE = re.compile(
+    r"\b(?:today|tonight|tomorrow|yesterday|next|this|coming|weekend"
+    r"|monday|tuesday|wednesday|thursday|friday|saturday|sunday"
+    r"|mon|tues?|wed|thu(?:rs)?|fri|sat|sun)s?\b"
+    r"|\bin\s+\d+\s+(?:days?|weeks?|months?)\b",
+    re.IGNORECASE,
+)
+
+
+# Static prompts, built once at import and shared by every extraction
+SYSTEM_PROMPT = """You are an expert at extracting structured event information from natural language text.
 
 Extract the following fields from the user's text:
 - title: A clear, concise event title (remove filler words like "Event", "Party", etc. if they're redundant)
@@ -52,12 +70,12 @@ Important guidelines:
 
 Return ONLY a valid JSON object with these fields. Do not include any other text."""
 
-    user_prompt = f"""Extract event information from this text. Pay special attention to location extraction - remove any prepositions or articles.
+USER_PROMPT_TEMPLATE = """Extract event information from this text. Pay special attention to location extraction - remove any prepositions or articles.
 
-Text: {req.text}
+Text: {text}
 
-Default timezone: {req.default_tz}
-Default start time if only date given: {req.default_start_time}
+Default timezone: {default_tz}
+Default start time if only date given: {default_start_time}
 
 Examples of correct location extraction:
 - "meeting at MIT Cambridge" → location_text: "MIT Cambridge"
@@ -67,40 +85,138 @@ Examples of correct location extraction:
 
 Return the extracted event data as JSON with clean, exact field values."""
 
+
+BATCH_PROMPT_HEADER = """Extract event information from each numbered text below. Pay special attention to location extraction - remove any prepositions or articles.
+
+"""
+
+BATCH_ITEM_TEMPLATE = """{index}. Text: {text}
+   Default timezone: {default_tz}
+   Default start time if only date given: {default_start_time}
+
+"""
+
+BATCH_PROMPT_FOOTER = """Return a JSON object of the form {"events": [...]} with exactly one event object per numbered text, in the same order, using the same fields as for a single event."""
+
+
+def _event_from_json(extracted_data: dict, default_tz: Optional[str]) -> EventSpec:
+    """Build an EventSpec from one event object returned by the model."""
+    # ISO datetime strings are parsed by pydantic-core's native parser during validation
+    return validate_event({
+        "title": extracted_data["title"],
+        "start": extracted_data["start"],
+        "end": extracted_data.get("end") or None,
+        "time_zone": default_tz or "UTC",
+        "location_text": extracted_data.get("location_text"),
+        "description_md": extracted_data.get("description_md"),
+        "privacy": extracted_data.get("privacy", "private"),
+    })
+
+
+def _request_completion(user_prompt: str, max_tokens: int = _MAX_TOKENS) -> str:
+    """Send one extraction prompt to OpenAI and return the raw JSON text."""
+    response = client.chat.completions.create(
+        model=_MODEL,
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ],
+        temperature=0.1,  # Low temperature for consistent extraction
+        max_tokens=max_tokens,
+        response_format={"type": "json_object"},
+    )
+    
+    content = response.choices[0].message.content
+    if not content:
+        raise ValueError("Empty response from OpenAI")
+    return content
+
+
+@lru_cache(maxsize=256)
+def _cached_event(user_prompt: str, default_tz: Optional[str]) -> EventSpec:
+    """Return the event for ``user_prompt``, from memory, disk, or OpenAI.
+    
+    The prompt embeds the text, timezone and default start time, and the key
+    also covers the system prompt, model and token limit, so changing any of
+    them invalidates old entries. A completion is only stored once it has
+    validated; a failure raises, which leaves both caches untouched.
+    """
+    key = hashlib.sha256(
+        f"{_MODEL}\0{_MAX_TOKENS}\0{SYSTEM_PROMPT}\0{user_prompt}".encode()
+    ).hexdigest()
+    path = Path(settings.extract_cache_dir).expanduser() / f"{key}.json"
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",  # Using GPT-4o-mini as the most capable mini model
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.1,  # Low temperature for consistent extraction
-            max_tokens=1000
-        )
+        return _event_from_json(json.loads(path.read_text(encoding="utf-8")), default_tz)
+    except Exception:
+        pass  # missing, unreadable or stale entry: ask OpenAI again
+    
+    content = _request_completion(user_prompt)
+    event = _event_from_json(json.loads(content), default_tz)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    except OSError:
+        pass  # caching is best-effort
+    return event
+
+
+def extract_event_with_llm(req: ExtractionRequest) -> EventSpec:
+    """Extract structured event data using OpenAI GPT model.
+    
+    Identical requests are answered from a cache when the text names an
+    explicit year and no relative date ("tomorrow", "Friday"), i.e. when its
+    meaning does not depend on today.
+    """
+    
+    user_prompt = USER_PROMPT_TEMPLATE.format(
+        text=req.text,
+        default_tz=req.default_tz,
+        default_start_time=req.default_start_time,
+    )
+
+    try:
+        if _EXPLICIT_YEAR_RE.search(req.text) and not _RELATIVE_DATE_RE.search(req.text):
+            return _cached_event(user_prompt, req.default_tz)
         
-        content = response.choices[0].message.content
-        if not content:
-            raise ValueError("Empty response from OpenAI")
-            
         # Parse the JSON response
-        extracted_data = json.loads(content)
+        extracted_data = json.loads(_request_completion(user_prompt))
         
-        # Convert string datetimes to datetime objects
-        start_dt = datetime.fromisoformat(extracted_data["start"])
-        end_dt = None
-        if extracted_data.get("end"):
-            end_dt = datetime.fromisoformat(extracted_data["end"])
+        return _event_from_json(extracted_data, req.default_tz)
         
-        # Create EventSpec with extracted data
-        return EventSpec(
-            title=extracted_data["title"],
-            start=start_dt,
-            end=end_dt,
-            time_zone=req.default_tz or "UTC",
-            location_text=extracted_data.get("location_text"),
-            description_md=extracted_data.get("description_md"),
-            privacy=extracted_data.get("privacy", "private")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Failed to parse OpenAI response as JSON: {e}")
+    except KeyError as e:
+        raise ValueError(f"Missing required field in OpenAI response: {e}")
+    except Exception as e:
+        raise ValueError(f"Error calling OpenAI API: {e}")
+
+
+def extract_events_batch(reqs: list[ExtractionRequest]) -> list[EventSpec]:
+    """Extract several events with a single OpenAI call.
+    
+    The texts are numbered in one prompt so the system prompt and the request
+    round-trip are paid once for the whole batch rather than once per event.
+    """
+    if not reqs:
+        return []
+    
+    user_prompt = BATCH_PROMPT_HEADER + "".join(
+        BATCH_ITEM_TEMPLATE.format(
+            index=i,
+            text=req.text,
+            default_tz=req.default_tz,
+            default_start_time=req.default_start_time,
         )
+        for i, req in enumerate(reqs, 1)
+    ) + BATCH_PROMPT_FOOTER
+
+    try:
+        content = _request_completion(user_prompt, max_tokens=_MAX_TOKENS * len(reqs))
+        events = json.loads(content)["events"]
+        if len(events) != len(reqs):
+            raise ValueError(f"Expected {len(reqs)} events, got {len(events)}")
+        
+        return [_event_from_json(data, req.default_tz) for data, req in zip(events, reqs)]
         
     except json.JSONDecodeError as e:
         raise ValueError(f"Failed to parse OpenAI response as JSON: {e}")
@@ -1,18 +1,104 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import Literal, Optional
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Annotated, Literal, Optional
 from zoneinfo import ZoneInfo, available_timezones
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    ValidationInfo,
+    field_validator,
+)
+
+
+# Files some system tzdata trees list alongside the zones that are not real
+# IANA zones ("localtime" is whatever the host is set to)
+_NON_ZONES = frozenset({"localtime", "posixrules", "Factory"})
+
+# available_timezones() walks the tzdata tree on every call, so build it once
+_AVAILABLE_TIMEZONES: frozenset[str] = frozenset(available_timezones()) - _NON_ZONES
+
+# Length given to events whose end time was not specified
+_DEFAULT_DURATION = timedelta(hours=4)
+# A same-day end that precedes its start is moved to the next day only when it
+# falls before this hour and the event then lasts at most _MAX_OVERNIGHT, i.e.
+# a real overnight event (10 PM-2 AM) rather than swapped times (7 PM-5 PM)
+_OVERNIGHT_END_HOUR = 6
+_MAX_OVERNIGHT = timedelta(hours=12)
+
+
+# Zone names that are plain UTC, served by the fixed-offset timezone.utc
+_UTC_NAMES = frozenset({"UTC", "Etc/UTC", "GMT", "Etc/GMT"})
+
+
+@lru_cache(maxsize=64)
+def _zoneinfo(name: str) -> tzinfo:
+    """Return the tzinfo for ``name``; instances are immutable, so they are shared.
+    
+    UTC names map to ``timezone.utc``, whose conversions need no
+    transition-table lookup.
+    """
+    if name in _UTC_NAMES:
+        return timezone.utc
+    return ZoneInfo(name)
+
+
+def refresh_timezones() -> None:
+    """Rebuild the cached timezone set, e.g. after tzdata is upgraded in a long-running server."""
+    global _AVAILABLE_TIMEZONES
+    _zoneinfo.cache_clear()
+    ZoneInfo.clear_cache()
+    _AVAILABLE_TIMEZONES = frozenset(available_timezones()) - _NON_ZONES
+
+
+def ensure_timezone(name: str) -> str:
+    """Return the timezone name unchanged, or raise ValueError if it is unknown."""
+    if name not in _AVAILABLE_TIMEZONES:
+        raise ValueError(f"Invalid timezone: {name}. Must be a valid IANA timezone.")
+    return name
+
+
+# Locale-independent names for previews, indexed by weekday() and month - 1
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def format_clock(dt: datetime, sep: str = "") -> str:
+    """Format a 12-hour clock time the way Partiful labels it, e.g. "6:00PM".
+    
+    Integer formatting avoids strftime's locale lookup, and always yields
+    AM/PM whatever the locale.
+    """
+    return f"{(dt.hour - 1) % 12 + 1}:{dt.minute:02d}{sep}{'AM' if dt.hour < 12 else 'PM'}"
+
+
+def _short_date(dt: datetime) -> str:
+    """Format a date like strftime("%a %b %d"), e.g. "Sun Sep 07"."""
+    return f"{_WEEKDAYS[dt.weekday()]} {_MONTHS[dt.month - 1]} {dt.day:02d}"
+
+
+def _normalize_privacy(v: object) -> object:
+    """Accept LLM variants like "Private" or " PUBLIC " for the privacy literal."""
+    return v.strip().lower() if isinstance(v, str) else v
+
+
+Privacy = Annotated[Literal["private", "public"], BeforeValidator(_normalize_privacy)]
 
 
 class EventSpec(BaseModel):
     """Strict, future-proof event specification with helpful defaults."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+    
     title: str = Field(..., description="Event name/title")
     start: datetime = Field(..., description="Event start datetime (timezone-aware)")
-    end: Optional[datetime] = Field(None, description="Event end datetime (auto-filled if None)")
+    end: Optional[datetime] = Field(
+        None, validate_default=True, description="Event end datetime (auto-filled if None)"
+    )
     time_zone: str = Field(
         default="America/New_York", 
         description="IANA timezone name for display purposes"
@@ -20,13 +106,13 @@ class EventSpec(BaseModel):
     location_text: Optional[str] = Field(None, description="Freeform location description")
     location_maps_url: Optional[str] = Field(None, description="Google Maps or similar URL")
     description_md: Optional[str] = Field(None, description="Event description in Markdown")
-    privacy: Literal["private", "public"] = Field(
+    privacy: Privacy = Field(
         default="private", 
         description="Event privacy setting"
     )
-    cohosts: list[str] = Field(default_factory=list, description="List of cohost names/emails")
-    rsvp_questions: list[str] = Field(
-        default_factory=list, 
+    cohosts: tuple[str, ...] = Field(default=(), description="Cohost names/emails")
+    rsvp_questions: tuple[str, ...] = Field(
+        default=(), 
         description="Custom RSVP questions"
     )
     cover_image_path: Optional[str] = "Sundai logo.png"
@@ -35,35 +121,57 @@ class EventSpec(BaseModel):
     @classmethod
     def validate_timezone(cls, v: str) -> str:
         """Validate timezone against zoneinfo.available_timezones()."""
-        if v not in available_timezones():
-            raise ValueError(f"Invalid timezone: {v}. Must be a valid IANA timezone.")
-        return v
+        return ensure_timezone(v)
     
-    @model_validator(mode="after")
-    def set_default_end(self) -> "EventSpec":
-        """Auto-fill end time if not provided (start + 4 hours)."""
-        if self.end is None:
-            self.end = self.start + timedelta(hours=4)
-        return self
+    @field_validator("end")
+    @classmethod
+    def set_default_end(cls, v: Optional[datetime], info: ValidationInfo) -> Optional[datetime]:
+        """Auto-fill end time if not provided (start + 4 hours) and require end > start.
+
+        A naive end given with an aware start is read in the start's zone, and a
+        same-day early-morning end before a late start (e.g. 10 PM-2 AM) is taken
+        to be on the next day.
+        """
+        start = info.data.get("start")
+        if start is None:
+            return v
+        if v is None:
+            return start + _DEFAULT_DURATION
+        if (v.tzinfo is None) != (start.tzinfo is None):
+            if v.tzinfo is not None:
+                raise ValueError("Event end has a timezone but its start does not")
+            v = v.replace(tzinfo=start.tzinfo)
+        if v < start:
+            end_local = v.astimezone(start.tzinfo) if start.tzinfo else v
+            next_day = v + timedelta(days=1)
+            if (
+                end_local.date() == start.date()
+                and end_local.hour < _OVERNIGHT_END_HOUR
+                and next_day - start <= _MAX_OVERNIGHT
+            ):
+                v = next_day
+        if v <= start:
+            raise ValueError("Event end must be after its start")
+        return v
     
     def as_human(self) -> str:
         """Return a concise one-line human preview with localized times."""
         try:
-            tz = ZoneInfo(self.time_zone)
+            tz = _zoneinfo(self.time_zone)
             start_local = self.start.astimezone(tz)
             end_local = self.end.astimezone(tz) if self.end else None
             
-            date_str = start_local.strftime("%a %b %d")
-            start_time = start_local.strftime("%I:%M %p").lstrip("0")
+            date_str = _short_date(start_local)
+            start_time = format_clock(start_local, sep=" ")
             
             if end_local and end_local.date() == start_local.date():
                 # Same day
-                end_time = end_local.strftime("%I:%M %p").lstrip("0")
+                end_time = format_clock(end_local, sep=" ")
                 time_str = f"{start_time}-{end_time}"
             elif end_local:
                 # Multi-day
-                end_date = end_local.strftime("%a %b %d")
-                end_time = end_local.strftime("%I:%M %p").lstrip("0")
+                end_date = _short_date(end_local)
+                end_time = format_clock(end_local, sep=" ")
                 time_str = f"{start_time} to {end_date} {end_time}"
             else:
                 time_str = start_time
@@ -77,6 +185,15 @@ class EventSpec(BaseModel):
             return f"{self.title} • {self.start.strftime('%Y-%m-%d %H:%M')}"
 
 
+def validate_event(data: dict) -> EventSpec:
+    """Validate a raw field dict (e.g. parsed LLM output) into an EventSpec.
+
+    Goes through the model's compiled core validator in one pass instead of
+    dispatching through ``EventSpec.__init__`` keyword by keyword.
+    """
+    return EventSpec.model_validate(data)
+
+
 # Legacy models for backward compatibility
 class Event(BaseModel):
     """Legacy event model - use EventSpec for new code."""
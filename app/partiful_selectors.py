@@ -9,35 +9,40 @@ TITLE_SELECTOR = "h1.EditableEventTitle_title__JRGfG"
 
 # Date/Time - trigger button and subsequent inputs
 DATE_TRIGGER = 'text="Set a date"'  # Playwright text selector
-DATE_INPUT_SELECTORS = [
+DATE_INPUT_SELECTORS = (
     'input[type="date"]',
-    'input[type="datetime-local"]', 
-    'input[placeholder*="date"]',
-    'input[placeholder*="Date"]',
+    'input[type="datetime-local"]',
+    'input[placeholder*="date" i]',  # Either capitalization
     'input[aria-label*="date"]',
-    '[data-testid*="date"]'
-]
+    '[data-testid*="date"]',
+)
 
 # Location - trigger and input (now with correct selector)
 LOCATION_TRIGGER = 'text="Location"'  # Will click the first Location text
-LOCATION_INPUT_SELECTORS = [
+LOCATION_INPUT_SELECTORS = (
     'input[placeholder="Place name, address, or link"]',  # Actual Partiful placeholder
     'input[type="search"]',  # The location input is type="search"
     'input[placeholder*="Place name"]',
     'input[placeholder*="address"]',
-    'input[placeholder*="location"]',
-    'input[placeholder*="Location"]',
-    'input[aria-label*="location"]'
-]
+    'input[placeholder*="location" i]',  # Either capitalization
+    'input[aria-label*="location"]',
+)
+# All of the above in one selector, so a single query covers every fallback.
+# A union matches in DOM order rather than list order, so it is scoped to the
+# location modal; otherwise an earlier input elsewhere on the page (such as a
+# search box) would win over the modal's own input
+LOCATION_INPUT_FUSED = '[role="dialog"] :is(' + ", ".join(LOCATION_INPUT_SELECTORS) + ")"
+LOCATION_SUGGESTION_SELECTOR = 'div[role="option"], .location-option, .search-suggestion, [data-testid*="suggestion"]'
 
 # Description - trigger and input area
 DESCRIPTION_TRIGGER = 'text="Add a description"'
-DESCRIPTION_INPUT_SELECTORS = [
-    'textarea[placeholder*="description"]',
-    'textarea[placeholder*="Description"]',
+DESCRIPTION_INPUT_SELECTORS = (
+    'textarea[placeholder*="description" i]',  # Either capitalization
     '[contenteditable="true"][role="textbox"]',
-    'textarea[aria-label*="description"]'
-]
+    'textarea[aria-label*="description"]',
+)
+# The description editor may be inline, so this one searches the whole page
+DESCRIPTION_INPUT_FUSED = ", ".join(DESCRIPTION_INPUT_SELECTORS)
 
 # Action buttons
 SAVE_DRAFT_BUTTON = 'button:has-text("Save draft")'
@@ -0,0 +1,56 @@
+"""Bounded retries for transient Playwright failures.
+
+Partiful's modals animate in and out, so a click can land while an element is
+detached, hidden, or covered by an overlay. Those failures clear up within a
+few hundred milliseconds; a missing element does not, so it is never retried.
+Timeouts are not retried either: callers pass a short per-attempt ``timeout``
+so a missing element fails fast instead of once per attempt.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import re
+from typing import Awaitable, Callable, TypeVar
+
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+T = TypeVar("T")
+
+# Messages Playwright uses for elements that exist but are not yet actionable
+_TRANSIENT_RE = re.compile(r"detached|not visible|intercept", re.IGNORECASE)
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Return True if a Playwright error is worth retrying."""
+    if isinstance(exc, PlaywrightTimeoutError):
+        # The call log of a timeout often mentions "not visible" as well
+        return False
+    return isinstance(exc, PlaywrightError) and bool(_TRANSIENT_RE.search(str(exc)))
+
+
+async def retriable(
+    fn: Callable[[], Awaitable[T]],
+    *,
+    max_retries: int = 3,
+    base: float = 0.25,
+    cap: float = 2.0,
+    jitter: float = 0.5,
+) -> T:
+    """Await ``fn()``, retrying transient Playwright errors with exponential backoff.
+
+    Attempt ``n`` sleeps ``min(cap, base * 2**n) * (1 + uniform(0, jitter))``
+    before trying again. Any other error, or the last transient one, is raised.
+    """
+    attempt = 0
+    while True:
+        try:
+            return await fn()
+        except PlaywrightError as e:
+            if attempt >= max_retries or not is_transient(e):
+                raise
+            delay = min(cap, base * 2 ** attempt) * (1 + random.uniform(0, jitter))
+            attempt += 1
+            await asyncio.sleep(delay)
@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 
 from .extract import extract, ExtractionRequest, ExtractionResponse
 
 app = FastAPI(title="Partiful Invite Generator", version="1.0.0")
 
 
-@app.post("/extract", response_model=ExtractionResponse)
-async def extract_event(request: ExtractionRequest) -> ExtractionResponse:
+# The handler already returns a validated ExtractionResponse, so it serializes
+# itself instead of going back through FastAPI's response-model validation.
+# ``responses`` keeps the schema in the OpenAPI docs.
+@app.post(
+    "/extract",
+    response_model=None,
+    responses={200: {"model": ExtractionResponse}},
+)
+async def extract_event(request: ExtractionRequest) -> Response:
     """Extract structured event data from natural language."""
-    return extract(request)
+    result = extract(request)
+    return Response(result.model_dump_json(), media_type="application/json")
 
 
 @app.get("/health")
@@ -21,6 +29,11 @@ async def health_check() -> dict[str, str]:
     return {"status": "healthy"}
 
 
+# FastAPI caches the OpenAPI document on first build; build it now that all
+# routes are registered so the first /docs or /openapi.json hit is not slow
+app.openapi()
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
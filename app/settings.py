@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import os
-from typing import List
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -14,12 +13,12 @@ class Settings(BaseSettings):
     default_tz: str = Field(default="America/New_York", description="Default timezone for events")
     
     # Partiful URLs (primary and fallback options)
-    partiful_create_urls: List[str] = Field(
-        default=[
+    partiful_create_urls: tuple[str, ...] = Field(
+        default=(
             "https://partiful.com/create",
             "https://www.partiful.com/create", 
             "https://partiful.com/invite/new"
-        ],
+        ),
         description="List of Partiful create event URLs to try"
     )
     
@@ -32,12 +31,29 @@ class Settings(BaseSettings):
         default=False, 
         description="Run browser in headless mode"
     )
+    block_third_party_requests: bool = Field(
+        default=True,
+        description="Block analytics hosts (and third-party assets when headless)"
+    )
+    debug_screenshots: bool = Field(
+        default=False,
+        description="Save screenshots and DOM dumps while filling the form"
+    )
+    batch_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of batch event forms filled at the same time"
+    )
     
     # OpenAI settings
     openai_api_key: str = Field(
         default="", 
         description="OpenAI API key for LLM extraction"
     )
+    extract_cache_dir: str = Field(
+        default="~/.cache/partiful/extract",
+        description="Directory for cached LLM extraction results"
+    )
     
     model_config = {
         "env_file": ".env",
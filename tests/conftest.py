@@ -0,0 +1,7 @@
+"""Shared test setup."""
+
+import os
+
+# app.extract builds its OpenAI client at import; every test replaces that
+# client, so a placeholder key is enough to import the module without one
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
@@ -1,20 +1,152 @@
 """Basic tests for the extraction functionality."""
 
+import json
 from datetime import datetime
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
 
-from app.extract import extract, ExtractionRequest
+import pytest
 
+import app.extract as extract_module
+from app.extract import extract, extract_events_batch, ExtractionRequest
 
-def test_extract():
-    """Test basic event extraction from natural language."""
-    req = ExtractionRequest(
-        text="Birthday party at John's house on Friday 7pm",
-        default_tz="America/New_York"
+BIRTHDAY_REQ = ExtractionRequest(
+    text="Birthday party at John's house on Friday 7pm",
+    default_tz="America/New_York"
+)
+
+
+class FrozenDatetime(datetime):
+    """datetime whose now() is fixed, so date fallbacks don't depend on the wall clock."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2024, 12, 15, 12, 0, tzinfo=tz)
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    """Replace the OpenAI client with one that replays queued JSON responses.
+    
+    Append response texts to ``.responses``; once they run out the last one is
+    repeated. Every request's keyword arguments are recorded in ``.calls``.
+    """
+    fake = SimpleNamespace(calls=[], responses=[])
+
+    def create(**kwargs):
+        fake.calls.append(kwargs)
+        content = fake.responses[min(len(fake.calls), len(fake.responses)) - 1]
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    monkeypatch.setattr(
+        extract_module, "client",
+        SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create))),
     )
+    return fake
+
+
+def test_extract(fake_openai):
+    """Test basic event extraction from natural language."""
+    fake_openai.responses.append(json.dumps({
+        "title": "Birthday party",
+        "start": "2024-12-20T19:00:00-05:00",
+        "location_text": "John's house",
+    }))
+    
+    response = extract(BIRTHDAY_REQ)
     
-    response = extract(req)
+    assert len(fake_openai.calls) == 1
+    assert response.event.title == "Birthday party"
+    assert response.event.start == datetime(2024, 12, 20, 19, 0, tzinfo=ZoneInfo("America/New_York"))
+    assert response.event.location_text == "John's house"
+    assert response.event.privacy == "private"
+    assert response.confidence == 0.9
+
+
+def test_extract_fallback(monkeypatch, fake_openai):
+    """Test that an unusable response falls back to the raw text at 7pm today."""
+    monkeypatch.setattr(extract_module, "datetime", FrozenDatetime)
+    fake_openai.responses.append("not json")
     
-    assert response.event.title
-    assert response.event.start
-    assert isinstance(response.event.start, datetime)
-    assert 0.0 <= response.confidence <= 1.0
+    response = extract(BIRTHDAY_REQ)
+    
+    assert response.event.title == BIRTHDAY_REQ.text
+    assert response.event.start == datetime(2024, 12, 15, 19, 0, tzinfo=ZoneInfo("America/New_York"))
+    assert response.confidence == 0.3
+
+
+def test_extract_events_batch(fake_openai):
+    """Test that a batch response is split into one EventSpec per request."""
+    fake_openai.responses.append(json.dumps({"events": [
+        {"title": "Birthday party", "start": "2025-09-05T19:00:00-04:00", "location_text": "John's house"},
+        {"title": "AI meetup", "start": "2025-09-07T18:00:00-04:00", "privacy": "public"},
+    ]}))
+
+    events = extract_events_batch([
+        ExtractionRequest(text="Birthday party at John's house on Friday 7pm", default_tz="America/New_York"),
+        ExtractionRequest(text="Public AI meetup Sunday 6pm", default_tz="America/New_York"),
+    ])
+
+    assert len(fake_openai.calls) == 1
+    assert fake_openai.calls[0]["max_tokens"] == 2 * extract_module._MAX_TOKENS
+    assert [e.title for e in events] == ["Birthday party", "AI meetup"]
+    assert events[0].location_text == "John's house"
+    assert events[1].privacy == "public"
+
+
+def test_extraction_is_cached(monkeypatch, tmp_path, fake_openai):
+    """Test that an identical absolute-date request is answered without a second API call."""
+    fake_openai.responses.append(json.dumps({"title": "AI meetup", "start": "2025-09-07T18:00:00-04:00"}))
+    monkeypatch.setattr(extract_module.settings, "extract_cache_dir", str(tmp_path))
+    extract_module._cached_event.cache_clear()
+
+    req = ExtractionRequest(text="AI meetup on Sept 7 2025 at 6pm", default_tz="America/New_York")
+    first = extract_module.extract_event_with_llm(req)
+    second = extract_module.extract_event_with_llm(req)
+
+    # A fresh process would find the result on disk
+    extract_module._cached_event.cache_clear()
+    third = extract_module.extract_event_with_llm(req)
+
+    assert len(fake_openai.calls) == 1
+    assert first == second == third
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+def test_extraction_cache_skips_implicit_year_and_invalid(monkeypatch, tmp_path, fake_openai):
+    """Test that yearless texts and responses that fail validation are never cached."""
+    fake_openai.responses.extend([
+        json.dumps({"title": "Dinner", "start": "2025-09-07T19:00:00-04:00"}),
+        json.dumps({"title": "Dinner", "start": "2025-09-07T19:00:00-04:00"}),
+        json.dumps({"title": "AI meetup"}),
+        json.dumps({"title": "AI meetup", "start": "2025-09-07T18:00:00-04:00"}),
+    ])
+    monkeypatch.setattr(extract_module.settings, "extract_cache_dir", str(tmp_path))
+    extract_module._cached_event.cache_clear()
+
+    dinner = ExtractionRequest(text="Dinner on Sept 7 at 7pm", default_tz="America/New_York")
+    extract_module.extract_event_with_llm(dinner)
+    extract_module.extract_event_with_llm(dinner)
+
+    meetup = ExtractionRequest(text="AI meetup on Sept 7 2025 at 6pm", default_tz="America/New_York")
+    with pytest.raises(ValueError):
+        extract_module.extract_event_with_llm(meetup)
+    extract_module.extract_event_with_llm(meetup)
+
+    assert len(fake_openai.calls) == 4
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+def test_extraction_cache_skips_weekday_names(monkeypatch, tmp_path, fake_openai):
+    """Test that full weekday names count as relative dates even when a year is given."""
+    fake_openai.responses.append(json.dumps({"title": "Offsite", "start": "2025-09-06T19:00:00-04:00"}))
+    monkeypatch.setattr(extract_module.settings, "extract_cache_dir", str(tmp_path))
+    extract_module._cached_event.cache_clear()
+
+    for text in ("Offsite Saturday 7pm, 2025 kickoff", "Standup Wednesday 9am, 2025 planning"):
+        req = ExtractionRequest(text=text, default_tz="America/New_York")
+        extract_module.extract_event_with_llm(req)
+        extract_module.extract_event_with_llm(req)
+
+    assert len(fake_openai.calls) == 4
+    assert not list(tmp_path.glob("*.json"))
@@ -0,0 +1,103 @@
+"""Tests for the event models."""
+
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from pydantic import ValidationError
+
+from app.models import EventSpec, refresh_timezones, validate_event
+
+
+def test_timezone_validation():
+    """Test that known timezones pass and unknown ones are rejected."""
+    start = datetime(2025, 9, 7, 18, 0, tzinfo=ZoneInfo("America/New_York"))
+
+    event = EventSpec(title="AI meetup", start=start, time_zone="America/New_York")
+    assert event.time_zone == "America/New_York"
+
+    with pytest.raises(ValidationError):
+        EventSpec(title="AI meetup", start=start, time_zone="Mars/Olympus_Mons")
+    with pytest.raises(ValidationError):
+        EventSpec(title="AI meetup", start=start, time_zone="localtime")
+
+    refresh_timezones()
+    assert EventSpec(title="AI meetup", start=start, time_zone="Europe/Paris").time_zone == "Europe/Paris"
+
+
+def test_validate_event_from_dict():
+    """Test that a raw field dict validates into an EventSpec with a default end."""
+    event = validate_event({
+        "title": "AI meetup",
+        "start": "2025-09-07T18:00:00-04:00",
+        "time_zone": "America/New_York",
+    })
+
+    assert isinstance(event.start, datetime)
+    assert event.end == event.start + timedelta(hours=4)
+
+
+def test_event_spec_is_frozen():
+    """Test that EventSpec rejects mutation and unknown fields."""
+    start = datetime(2025, 9, 7, 18, 0, tzinfo=ZoneInfo("America/New_York"))
+    event = EventSpec(title="AI meetup", start=start)
+
+    with pytest.raises(ValidationError):
+        event.title = "Other"
+
+    with pytest.raises(ValidationError):
+        EventSpec(title="AI meetup", start=start, venue="MIT")
+
+    updated = event.model_copy(update={"cover_image_path": "cover.png"})
+    assert updated.cover_image_path == "cover.png"
+    assert event.cover_image_path == "Sundai logo.png"
+
+
+def test_privacy_is_normalized():
+    """Test that loosely formatted privacy values from the LLM are accepted."""
+    start = datetime(2025, 9, 7, 18, 0, tzinfo=ZoneInfo("America/New_York"))
+
+    assert EventSpec(title="AI meetup", start=start, privacy=" Public ").privacy == "public"
+
+    with pytest.raises(ValidationError):
+        EventSpec(title="AI meetup", start=start, privacy="secret")
+
+
+def test_end_must_follow_start():
+    """Test that an end time at or before the start is rejected."""
+    start = datetime(2025, 9, 7, 18, 0, tzinfo=ZoneInfo("America/New_York"))
+
+    with pytest.raises(ValidationError):
+        EventSpec(title="AI meetup", start=start, end=start)
+    with pytest.raises(ValidationError):
+        EventSpec(title="AI meetup", start=start, end=start - timedelta(days=1))
+
+
+def test_end_overnight_and_naive():
+    """Test overnight roll-over, rejection of swapped times, and localizing a naive end."""
+    start = datetime(2025, 9, 7, 22, 0, tzinfo=ZoneInfo("America/New_York"))
+
+    overnight = EventSpec(title="AI meetup", start=start, end=start.replace(hour=2))
+    assert overnight.end == datetime(2025, 9, 8, 2, 0, tzinfo=ZoneInfo("America/New_York"))
+
+    with pytest.raises(ValidationError):
+        EventSpec(title="AI meetup", start=start.replace(hour=19), end=start.replace(hour=17))
+    with pytest.raises(ValidationError):
+        EventSpec(title="AI meetup", start=start.replace(hour=9), end=start.replace(hour=2))
+
+    naive_end = EventSpec(title="AI meetup", start=start, end=datetime(2025, 9, 7, 23, 30))
+    assert naive_end.end == datetime(2025, 9, 7, 23, 30, tzinfo=ZoneInfo("America/New_York"))
+
+
+def test_as_human_preview():
+    """Test that the preview shows localized same-day and multi-day times."""
+    start = datetime(2025, 9, 7, 22, 0, tzinfo=ZoneInfo("UTC"))
+
+    same_day = EventSpec(title="AI meetup", start=start, location_text="MIT")
+    assert same_day.as_human() == "AI meetup • Sun Sep 07 6:00 PM-10:00 PM at MIT"
+
+    multi_day = EventSpec(title="AI meetup", start=start, end=start + timedelta(days=1))
+    assert multi_day.as_human() == "AI meetup • Sun Sep 07 6:00 PM to Mon Sep 08 6:00 PM"
+
+    utc = EventSpec(title="AI meetup", start=start, time_zone="Etc/UTC")
+    assert utc.as_human() == "AI meetup • Sun Sep 07 10:00 PM to Mon Sep 08 2:00 AM"
@@ -0,0 +1,67 @@
+"""Tests for the Playwright retry helper."""
+
+import asyncio
+
+import pytest
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from app.retry import retriable
+
+
+def test_retries_transient_errors():
+    """Test that detached-element errors are retried until the action succeeds."""
+    calls = []
+
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise PlaywrightError("Element is detached from the DOM")
+        return "clicked"
+
+    result = asyncio.run(retriable(flaky, base=0, cap=0))
+
+    assert result == "clicked"
+    assert len(calls) == 3
+
+
+def test_does_not_retry_permanent_errors():
+    """Test that errors other than transient ones are raised immediately."""
+    calls = []
+
+    async def missing():
+        calls.append(1)
+        raise PlaywrightError("No node found for selector")
+
+    with pytest.raises(PlaywrightError):
+        asyncio.run(retriable(missing, base=0, cap=0))
+
+    assert len(calls) == 1
+
+
+def test_gives_up_after_max_retries():
+    """Test that a persistent transient error is raised once retries run out."""
+    calls = []
+
+    async def covered():
+        calls.append(1)
+        raise PlaywrightError("<div> intercepts pointer events")
+
+    with pytest.raises(PlaywrightError):
+        asyncio.run(retriable(covered, max_retries=2, base=0, cap=0))
+
+    assert len(calls) == 3
+
+
+def test_does_not_retry_timeouts():
+    """Test that a timeout is raised at once rather than waited out on every attempt."""
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        raise PlaywrightTimeoutError("Timeout 1500ms exceeded: element is not visible")
+
+    with pytest.raises(PlaywrightTimeoutError):
+        asyncio.run(retriable(slow, base=0, cap=0))
+
+    assert len(calls) == 1